@@ -42,6 +42,9 @@ class PublisherConfig(BaseSettings):
     gitlab_url: str = Field(default="https://gitlab.com", description="GitLab Instance URL")
     gitlab_token: Optional[SecretStr] = Field(default=None, description="GitLab Private Token")
     gitlab_project_id: Optional[str] = Field(default=None, description="GitLab Project ID")
+    gitlab_concurrency: Optional[int] = Field(
+        default=None, ge=1, description="Parallel GitLab API calls for bulk operations (default: 3 x CPUs, up to 20)"
+    )
 
     @property
     def lfs_threshold_bytes(self) -> int:
@@ -30,3 +30,12 @@ class AssayClient(ABC):
             RuntimeError: If the report cannot be retrieved or is invalid.
         """
         pass  # pragma: no cover
+
+    @abstractmethod
+    def close(self) -> None:
+        """
+        Releases the resources held by the client, such as pooled HTTP connections.
+
+        Called once the client is no longer needed (at server shutdown or the end of a CLI command).
+        """
+        pass  # pragma: no cover
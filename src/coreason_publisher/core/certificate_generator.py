@@ -10,7 +10,7 @@
 
 import importlib.resources
 from datetime import datetime, timezone
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from jinja2 import Template
 
@@ -23,6 +23,10 @@ class CertificateGenerator:
     TEMPLATE_PACKAGE = "coreason_publisher.templates"
     TEMPLATE_NAME = "certificate.md.j2"
 
+    def __init__(self) -> None:
+        # Compiled on first use and reused; the packaged template doesn't change at runtime.
+        self._template: Optional[Template] = None
+
     def generate(self, report_data: Dict[str, Any]) -> str:
         """
         Generates the CoA markdown content.
@@ -47,8 +51,7 @@ class CertificateGenerator:
         self._validate_report_data(report_data)
 
         try:
-            template_content = self._load_template()
-            template = Template(template_content)
+            template = self._get_template()
         except Exception as e:
             logger.error(f"Failed to load template: {e}")
             raise RuntimeError(f"Failed to load template: {e}") from e
@@ -80,6 +83,12 @@ class CertificateGenerator:
         if "score" not in data["results"]:
             raise ValueError("Missing 'score' in results")
 
+    def _get_template(self) -> Template:
+        """Returns the compiled template, loading and compiling it on first use."""
+        if self._template is None:
+            self._template = Template(self._load_template())
+        return self._template
+
     def _load_template(self) -> str:
         """Loads the jinja2 template from the package resources."""
         # Use files() for python 3.9+ compatibility (we are 3.12)
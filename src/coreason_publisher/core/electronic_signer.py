@@ -12,12 +12,15 @@ import hashlib
 import json
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 
 from coreason_identity.models import UserContext
 
 from coreason_publisher.utils.logger import logger
 
+# Read size for bundle hashing (as hashlib.file_digest, but large enough for model weights)
+_HASH_CHUNK_SIZE = 1024 * 1024
+
 
 class ElectronicSigner:
     """
@@ -38,8 +41,8 @@ class ElectronicSigner:
 
         sha256_hash = hashlib.sha256()
 
-        # Collect all files to hash
-        files_to_hash: List[Path] = []
+        # Collect all files to hash, with their normalized relative path (computed once per file)
+        files_to_hash: List[Tuple[str, Path]] = []
 
         for file_path in bundle_path.rglob("*"):
             if not file_path.is_file() or file_path.is_symlink():
@@ -57,26 +60,30 @@ class ElectronicSigner:
             # The requirement says "The 'Thick' Artifact... exact Prompts, Code, Test Data, and Model Weights"
             # So we should be very inclusive. Only skipping .git is safe.
 
-            files_to_hash.append(file_path)
+            # Normalize to forward slash
+            files_to_hash.append((str(rel_path).replace("\\", "/"), file_path))
 
         # Sort strictly by normalized relative path string to ensure determinism across platforms
         # We replace backslashes with forward slashes BEFORE sorting to ensure consistency
-        files_to_hash.sort(key=lambda p: str(p.relative_to(bundle_path)).replace("\\", "/"))
+        files_to_hash.sort(key=lambda item: item[0])
 
         logger.info(f"Hashing {len(files_to_hash)} files in {bundle_path}")
 
-        for file_path in files_to_hash:
-            rel_path_str = str(file_path.relative_to(bundle_path)).replace("\\", "/")  # Normalize to forward slash
+        # One reusable read buffer for every file: large chunks keep the Python-level loop short on
+        # multi-GB weights, and readinto avoids allocating a new bytes object per chunk.
+        buffer = bytearray(_HASH_CHUNK_SIZE)
+        view = memoryview(buffer)
 
+        for rel_path_str, file_path in files_to_hash:
             # Update hash with filename first to detect renames
             sha256_hash.update(rel_path_str.encode("utf-8"))
 
             # Update hash with file content
             try:
                 # Read in chunks for memory efficiency
-                with open(file_path, "rb") as f:
-                    for byte_block in iter(lambda: f.read(4096), b""):
-                        sha256_hash.update(byte_block)
+                with open(file_path, "rb", buffering=0) as f:
+                    while size := f.readinto(buffer):
+                        sha256_hash.update(view[:size])
             except OSError as e:
                 logger.error(f"Failed to read file {file_path} for hashing: {e}")
                 raise RuntimeError(f"Failed to read file {file_path} for hashing: {e}") from e
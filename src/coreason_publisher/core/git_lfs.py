@@ -8,22 +8,120 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_publisher
 
+import fnmatch
 import os
 import re
 import shutil
 import subprocess
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
 from pathlib import Path
-from typing import List
+from typing import Callable, Dict, Generator, Iterable, Iterator, List, Optional, Tuple, Union
 
 from coreason_publisher.utils.logger import logger
 
+# Marks a cached value that hasn't been computed yet (None is a valid cached result).
+_UNSET = object()
+
+# Directory listings are I/O-bound, so the scan uses more threads than cores.
+_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Version-control metadata never holds workspace content, so the directory walk doesn't enter it.
+_VCS_METADATA = frozenset({".git", ".hg", ".svn"})
+
+# How long a successful repository probe is reused. Long enough to cover one publish
+# (is_initialized -> verify_ready -> track_patterns), short enough that a long-lived
+# instance notices outside changes such as a removed hook or a re-configured remote.
+_PROBE_TTL = 5.0
+
+# How much of the pre-push hook verify_ready reads when looking for the git-lfs call.
+# Generous next to the few lines git-lfs writes, to leave room for a hook manager's preamble.
+_HOOK_READ_BYTES = 64 * 1024
+
+# A "git-lfs" or "git lfs" invocation on a line that isn't commented out. As in the shell, a "#"
+# only starts a comment at the start of a line or after whitespace, so "$#" or "#" inside a word
+# doesn't hide the call that follows it.
+_HOOK_LFS_RE = re.compile(rb"^(?:[^#\n]|(?<=\S)#)*?\bgit[- ]lfs\b", re.MULTILINE)
+
+# Optional predicate on a file's name; files it rejects are skipped before their size is looked up.
+_NameFilter = Optional[Callable[[str], object]]
+
+# Resolved repository path -> (time.monotonic() of the probe, its result)
+_ProbeCache = Dict[Path, Tuple[float, "subprocess.CompletedProcess[str]"]]
+
+
+# Room left in ARG_MAX for anything the budget below doesn't count (e.g. the auxiliary vector).
+_ARG_HEADROOM = 4096
+
+# The smallest ARG_MAX POSIX allows, for systems where sysconf can't report it.
+_POSIX_ARG_MAX = 4096
+
+# CreateProcess caps a Windows command line at 32767 characters; unlike exec's ARG_MAX, the
+# environment is passed separately and doesn't count. Slightly under, for the program path quoting.
+_WINDOWS_CMDLINE_BUDGET = 32000
+
+
+def _arg_budget() -> int:
+    """Bytes available for one command line: ARG_MAX minus the environment it is passed along with."""
+    if os.name == "nt":
+        return _WINDOWS_CMDLINE_BUDGET
+    try:
+        arg_max = os.sysconf("SC_ARG_MAX")
+    except (ValueError, OSError):
+        arg_max = _POSIX_ARG_MAX
+    env_size = sum(len(key) + len(value) + 2 for key, value in os.environ.items())
+    return arg_max - env_size - _ARG_HEADROOM
+
+
+def _chunk_args(base_cmd: List[str], args: List[str], budget: int) -> Iterator[List[str]]:
+    """
+    Packs args greedily into as few ``base_cmd + chunk`` command lines as fit in budget bytes.
+
+    Each argument costs its encoded length, a NUL terminator and an argv pointer. An argument
+    that doesn't fit on its own still gets a command line of its own (and the exec reports it).
+    """
+    pointer_size = 8
+
+    def cost(arg: str) -> int:
+        return len(os.fsencode(arg)) + 1 + pointer_size
+
+    base_cost = sum(cost(arg) for arg in base_cmd)
+    chunk: List[str] = []
+    used = base_cost
+    for arg in args:
+        arg_cost = cost(arg)
+        if chunk and used + arg_cost > budget:
+            yield base_cmd + chunk
+            chunk = []
+            used = base_cost
+        chunk.append(arg)
+        used += arg_cost
+    if chunk:
+        yield base_cmd + chunk
+
 
 class GitLFS:
     """Wrapper around git-lfs CLI."""
 
+    def __init__(self) -> None:
+        # Result of the PATH lookup for git-lfs; _UNSET until the first is_installed() call
+        self._git_lfs_path: Union[str, None, object] = _UNSET
+        # Successful probe results, keyed by resolved repository path
+        self._rev_parse_cache: _ProbeCache = {}
+        self._lfs_env_cache: _ProbeCache = {}
+
     def is_installed(self) -> bool:
-        """Checks if git-lfs is installed on the system."""
-        return shutil.which("git-lfs") is not None
+        """Checks if git-lfs is installed on the system. The PATH lookup is done once per instance."""
+        if self._git_lfs_path is _UNSET:
+            self._git_lfs_path = shutil.which("git-lfs")
+        return self._git_lfs_path is not None
+
+    def invalidate_cache(self) -> None:
+        """Forgets the cached git-lfs lookup and repository probes, e.g. after installing git-lfs."""
+        self._git_lfs_path = _UNSET
+        self._rev_parse_cache.clear()
+        self._lfs_env_cache.clear()
 
     def is_initialized(self, repo_path: Path) -> bool:
         """
@@ -33,26 +131,18 @@ class GitLFS:
         AND verifying the endpoint configuration.
         """
         try:
-            # Check if it is a git repo first by running a git command,
-            # which works even in subdirectories.
-            is_git_check = subprocess.run(
-                ["git", "rev-parse", "--is-inside-work-tree"],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                check=False,
-            )
+            # The two probes are independent, so `git lfs env` runs on a worker thread while
+            # rev-parse runs here; the wait is the slower of the two rather than their sum.
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                lfs_env = pool.submit(self._lfs_env, repo_path)
+                # Check if it is a git repo by running a git command, which works even in subdirectories.
+                is_git_check = self._rev_parse(repo_path)
+                result = lfs_env.result()
+
             if is_git_check.returncode != 0:
                 logger.error(f"{repo_path} is not inside a git work tree.")
                 return False
 
-            result = subprocess.run(
-                ["git", "lfs", "env"],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                check=False,
-            )
             if result.returncode != 0:
                 logger.debug(f"git lfs env failed: {result.stderr}")
                 return False
@@ -69,6 +159,41 @@ class GitLFS:
             logger.exception(f"Error checking LFS initialization: {e}")
             return False
 
+    def _rev_parse(self, repo_path: Path) -> "subprocess.CompletedProcess[str]":
+        """
+        Runs a single `git rev-parse` that answers both "is this inside a work tree?" and
+        "where is the hooks directory?", so is_initialized and verify_ready share one git call.
+
+        Successful results are cached per resolved path (see _cached_probe).
+        """
+        return self._cached_probe(
+            self._rev_parse_cache, ["git", "rev-parse", "--is-inside-work-tree", "--git-path", "hooks"], repo_path
+        )
+
+    def _lfs_env(self, repo_path: Path) -> "subprocess.CompletedProcess[str]":
+        """Runs `git lfs env`, caching successful results per resolved path."""
+        return self._cached_probe(self._lfs_env_cache, ["git", "lfs", "env"], repo_path)
+
+    @staticmethod
+    def _cached_probe(cache: _ProbeCache, cmd: List[str], repo_path: Path) -> "subprocess.CompletedProcess[str]":
+        """
+        Runs a read-only git probe, reusing a successful result for up to _PROBE_TTL seconds.
+
+        Failures are never cached, so a repository that is fixed in the meantime is seen straight away.
+        """
+        key = repo_path.resolve()
+        now = time.monotonic()
+        cached = cache.get(key)
+        if cached is not None and now - cached[0] < _PROBE_TTL:
+            return cached[1]
+
+        result = subprocess.run(cmd, cwd=repo_path, capture_output=True, text=True, check=False)
+        if result.returncode == 0:
+            cache[key] = (now, result)
+        else:
+            cache.pop(key, None)
+        return result
+
     def verify_ready(self, repo_path: Path) -> None:
         """
         Verifies that Git LFS is installed, initialized, AND hooks are present.
@@ -89,15 +214,13 @@ class GitLFS:
 
         # Deep verification: Check for pre-push hook
         try:
-            # Get hooks directory using --git-path (handles worktrees/submodules correctly)
-            hooks_path_proc = subprocess.run(
-                ["git", "rev-parse", "--git-path", "hooks"],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            hooks_path_str = hooks_path_proc.stdout.strip()
+            # Get hooks directory using --git-path (handles worktrees/submodules correctly).
+            # This reuses the rev-parse that is_initialized already ran; the hooks path is its last line.
+            hooks_path_proc = self._rev_parse(repo_path)
+            if hooks_path_proc.returncode != 0:
+                logger.error(f"Failed to determine git directory: {hooks_path_proc.stderr}")
+                raise RuntimeError(f"Failed to determine git directory: {hooks_path_proc.stderr}")
+            hooks_path_str = hooks_path_proc.stdout.strip().splitlines()[-1].strip()
 
             # Resolve path (relative to repo root or absolute)
             if Path(hooks_path_str).is_absolute():
@@ -113,9 +236,11 @@ class GitLFS:
                 logger.error(f"LFS pre-push hook missing at {pre_push_hook}")
                 raise RuntimeError("Git LFS pre-push hook is missing. Run 'git lfs install'.")
 
-            # Check content
-            content = pre_push_hook.read_text(encoding="utf-8", errors="ignore")
-            if "git-lfs" not in content and "git lfs" not in content:
+            # Check content. Only the head of the script is read, as raw bytes: the git-lfs call
+            # sits near the top of any real hook, and no decoding is needed to find it.
+            with pre_push_hook.open("rb") as hook:
+                content = hook.read(_HOOK_READ_BYTES)
+            if _HOOK_LFS_RE.search(content) is None:
                 logger.error(f"LFS pre-push hook at {pre_push_hook} does not seem to call git-lfs")
                 raise RuntimeError("Git LFS pre-push hook exists but does not appear to call git-lfs.")
 
@@ -124,9 +249,6 @@ class GitLFS:
                 logger.error(f"LFS pre-push hook at {pre_push_hook} is not executable")
                 raise RuntimeError("Git LFS pre-push hook is not executable. Run 'chmod +x .git/hooks/pre-push'.")
 
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Failed to determine git directory: {e}")
-            raise RuntimeError(f"Failed to determine git directory: {e}") from e
         except OSError as e:
             logger.error(f"Failed to verify hooks: {e}")
             raise RuntimeError(f"Failed to verify hooks: {e}") from e
@@ -136,64 +258,179 @@ class GitLFS:
     def initialize(self, repo_path: Path) -> None:
         """Initializes git-lfs in the repository."""
         logger.info(f"Initializing Git LFS in {repo_path}")
+        # Installing changes both the LFS environment and the hooks, so drop what was cached
+        self._rev_parse_cache.clear()
+        self._lfs_env_cache.clear()
+        self._run_quiet(["git", "lfs", "install"], repo_path, "Failed to initialize Git LFS")
+
+    @staticmethod
+    def _run_quiet(cmd: List[str], cwd: Path, failure_message: str) -> None:
+        """
+        Runs a git command whose output isn't used.
+
+        stdout goes to /dev/null and stderr is kept as raw bytes, so only the
+        error path pays for decoding. The exit status is checked directly rather
+        than through check=True, so success never builds a CalledProcessError.
+
+        Raises:
+            RuntimeError: "<failure_message>: <stderr>" if the command fails, or if git can't be found.
+        """
         try:
-            subprocess.run(
-                ["git", "lfs", "install"],
-                cwd=repo_path,
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Failed to initialize Git LFS: {e.stderr}")
-            raise RuntimeError(f"Failed to initialize Git LFS: {e.stderr}") from e
+            result = subprocess.run(cmd, cwd=cwd, check=False, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
         except FileNotFoundError as e:
             logger.error("Git executable not found")
             raise RuntimeError("Git executable not found") from e
+        if result.returncode != 0:
+            stderr = result.stderr.decode("utf-8", errors="replace")
+            logger.error(f"{failure_message}: {stderr}")
+            raise RuntimeError(f"{failure_message}: {stderr}")
 
-    def find_large_files(self, search_path: Path, threshold_bytes: int) -> List[str]:
+    def find_large_files(self, search_path: Path, threshold_bytes: int, limit: Optional[int] = None) -> List[str]:
         """
         Recursively finds files in the search path larger than the threshold.
 
+        Collects and sorts the output of iter_large_files; see there for how the tree is scanned.
+
         Args:
             search_path: The root directory to search.
             threshold_bytes: The size threshold in bytes.
+            limit: Stop scanning once this many large files have been found. Which files
+                make the cut depends on scan order, so use it for "are there any" checks
+                rather than for a stable subset.
 
         Returns:
-            A list of file paths relative to search_path.
+            A sorted list of file paths relative to search_path, using forward slashes.
         """
-        large_files: List[str] = []
-        logger.info(f"Scanning {search_path} for files larger than {threshold_bytes} bytes")
+        # Files are found in any order; sorting gives callers a stable result
+        return sorted(islice(self.iter_large_files(search_path, threshold_bytes), limit))
 
-        if not search_path.exists():
-            logger.warning(f"Search path does not exist: {search_path}")
+    def find_matching_large_files(self, search_path: Path, threshold_bytes: int, patterns: Iterable[str]) -> List[str]:
+        """
+        Like find_large_files, but only for files whose name matches one of the glob patterns.
+
+        Patterns are matched against the file name (as a .gitattributes pattern without a
+        slash is), and files that don't match are never stat'ed, so a narrow pattern set
+        over a large tree costs little more than the directory listings.
+
+        Args:
+            search_path: The root directory to search.
+            threshold_bytes: The size threshold in bytes.
+            patterns: fnmatch-style name patterns, e.g. ``["*.bin", "*.pt"]``.
+
+        Returns:
+            A sorted list of file paths relative to search_path, using forward slashes.
+        """
+        patterns = list(patterns)
+        if not patterns:
             return []
+        # One alternation, compiled once, instead of an fnmatch call per pattern per file
+        name_re = re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns))
+        return sorted(self.iter_large_files(search_path, threshold_bytes, name_filter=name_re.match))
 
-        try:
-            for file_path in search_path.rglob("*"):
-                try:
-                    if file_path.is_file() and not file_path.is_symlink():
-                        # Exclude .git directory from scan to match robust behavior
-                        if ".git" in file_path.parts:
-                            continue
+    def iter_large_files(
+        self, search_path: Path, threshold_bytes: int, name_filter: _NameFilter = None
+    ) -> Generator[str, None, None]:
+        """
+        Yields the files in the search path larger than the threshold, as they are found.
 
-                        if file_path.stat().st_size > threshold_bytes:
-                            # Use relative path for cleaner tracking
-                            relative_path = file_path.relative_to(search_path).as_posix()
-                            large_files.append(relative_path)
-                except OSError as e:
-                    logger.warning(f"Could not check file size for {file_path}: {e}")
+        Preferred over find_large_files when the caller can act on results one at a time
+        or stop early: nothing is buffered, and closing the generator cancels the rest of
+        the scan. Results come in no particular order.
+
+        Directories are listed with ``os.scandir`` on a thread pool, one task per
+        directory, so the metadata lookups of sibling directories overlap. Only regular
+        files are reported: symlinks, FIFOs, sockets and device nodes are skipped, as is
+        anything inside ``.git``, ``.hg`` or ``.svn``. .gitignore is not consulted.
+
+        Args:
+            search_path: The root directory to search.
+            threshold_bytes: The size threshold in bytes.
+            name_filter: If given, only files whose name it returns a truthy value for are considered.
+
+        Yields:
+            File paths relative to search_path, using forward slashes.
+        """
+        logger.info(f"Scanning {search_path} for files larger than {threshold_bytes} bytes")
+
+        # Checked before the thread pool is started; a file path has nothing to scan either
+        if not os.path.isdir(search_path):
+            logger.warning(f"Search path does not exist or is not a directory: {search_path}")
+            return
+
+        try:
+            yield from self._iter_large(os.fspath(search_path), threshold_bytes, name_filter)
         except Exception as e:
             logger.error(f"Error during large file scan: {e}")
             raise
 
-        return large_files
+    def _iter_large(self, base: str, threshold_bytes: int, name_filter: _NameFilter = None) -> Iterator[str]:
+        """Yields the paths (relative to base, forward slashes) of files over the threshold as directories finish."""
+        # Every DirEntry.path under base starts with this prefix, so relative paths are a slice
+        # (os.path.relpath would re-normalise both paths for every file).
+        prefix_len = len(os.path.join(base, ""))
+        with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as pool:
+            pending = {pool.submit(self._scan_directory, base, threshold_bytes, name_filter)}
+            try:
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        files, subdirs = future.result()
+                        # Queue the subdirectories before yielding so the pool stays busy while the caller consumes
+                        pending.update(
+                            pool.submit(self._scan_directory, d, threshold_bytes, name_filter) for d in subdirs
+                        )
+                        for file_path in files:
+                            # Use relative path for cleaner tracking
+                            relative_path = file_path[prefix_len:]
+                            yield relative_path if os.sep == "/" else relative_path.replace(os.sep, "/")
+            finally:
+                # The caller stopped early (limit reached or an error): drop directories not yet started
+                for future in pending:
+                    future.cancel()
+
+    @staticmethod
+    def _scan_directory(
+        directory: str, threshold_bytes: int, name_filter: _NameFilter = None
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Lists one directory, returning (paths of files over the threshold, subdirectories to scan).
 
-    def track_patterns(self, repo_path: Path, patterns: List[str]) -> None:
+        ``DirEntry`` carries the file type from the directory listing, so symlinks and
+        non-regular files are filtered out without a syscall and only regular files are stat'ed.
+        """
+        files: List[str] = []
+        subdirs: List[str] = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    # Exclude VCS metadata (.git and friends) from scan to match robust behavior
+                    if entry.name in _VCS_METADATA:
+                        continue
+                    try:
+                        if entry.is_symlink():
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            if name_filter is not None and not name_filter(entry.name):
+                                continue
+                            if entry.stat(follow_symlinks=False).st_size > threshold_bytes:
+                                files.append(entry.path)
+                    except OSError as e:
+                        logger.warning(f"Could not check file size for {entry.path}: {e}")
+        except OSError as e:
+            logger.warning(f"Could not scan directory {directory}: {e}")
+        return files, subdirs
+
+    def track_patterns(self, repo_path: Path, patterns: Iterable[str]) -> None:
         """
         Tracks the given file patterns using git-lfs.
         Ensures idempotency by checking .gitattributes first.
+
+        Patterns may come from several groups (e.g. ``itertools.chain(*groups)``); duplicates
+        are dropped, keeping first-seen order, so all of them go to a single `git lfs track`.
         """
+        patterns = list(dict.fromkeys(patterns))
         if not patterns:
             return
 
@@ -226,18 +463,6 @@ class GitLFS:
             return
 
         logger.info(f"Tracking new patterns with Git LFS: {new_patterns}")
-        try:
-            cmd = ["git", "lfs", "track"] + new_patterns
-            subprocess.run(
-                cmd,
-                cwd=repo_path,
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Failed to track patterns: {e.stderr}")
-            raise RuntimeError(f"Failed to track patterns: {e.stderr}") from e
-        except FileNotFoundError as e:
-            logger.error("Git executable not found")
-            raise RuntimeError("Git executable not found") from e
+        # Normally a single command; thousands of patterns are split so no exec exceeds ARG_MAX
+        for cmd in _chunk_args(["git", "lfs", "track"], new_patterns, _arg_budget()):
+            self._run_quiet(cmd, repo_path, "Failed to track patterns")
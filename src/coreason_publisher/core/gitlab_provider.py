@@ -8,15 +8,55 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_publisher
 
-from typing import Optional
-
-import gitlab
-from gitlab.v4.objects import Project
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Sequence, Tuple, Type, TypeVar
 
 from coreason_publisher.config import PublisherConfig
 from coreason_publisher.core.git_provider import GitProvider
 from coreason_publisher.utils.logger import logger
 
+# python-gitlab (and requests under it) takes ~100 ms to import, which CLI runs that never
+# talk to GitLab shouldn't pay. It is imported by the first GitLabProvider, or by the first
+# access to this module's ``gitlab`` attribute (e.g. from mock.patch), and bound as a global.
+if TYPE_CHECKING:
+    import gitlab
+    import requests
+    from gitlab.v4.objects import Project
+
+
+# Connections kept per GitLab host. One publish makes a handful of sequential calls against a
+# single host; the headroom is for concurrent bulk calls sharing the same session.
+_POOL_SIZE = 20
+
+# Transient failures retried on reads only. Writes (MR/tag/note creation, merges) may have
+# been applied despite a 5xx, so retrying them could duplicate or spuriously fail them.
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF = 0.5
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+_RETRY_METHODS = frozenset({"GET", "HEAD"})
+
+
+T = TypeVar("T")
+
+
+def _import_gitlab() -> ModuleType:
+    """Imports python-gitlab and binds it as this module's ``gitlab`` global, unless that is already bound."""
+    if "gitlab" not in globals():
+        import gitlab as gitlab_module
+
+        globals()["gitlab"] = gitlab_module
+    bound: ModuleType = globals()["gitlab"]
+    return bound
+
+
+def __getattr__(name: str) -> Any:
+    if name == "gitlab":
+        return _import_gitlab()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 class GitLabProvider(GitProvider):
     """GitLab implementation of the GitProvider interface."""
@@ -43,20 +83,61 @@ class GitLabProvider(GitProvider):
 
         self.token = self.config.gitlab_token.get_secret_value()
         self.url = self.config.gitlab_url
-        self.gl = gitlab.Gitlab(url=self.url, private_token=self.token)
+        # Every method refers to the module-level ``gitlab`` name, so import it before any are called
+        _import_gitlab()
+        self.gl = gitlab.Gitlab(
+            url=self.url,
+            private_token=self.token,
+            session=self._build_session(),
+        )
         self.project_id = project_id
-        self._project: Optional[Project] = None
+        self._project: Optional["Project"] = None
+        self._project_lock = threading.Lock()
+        # API calls are latency-bound, so bulk operations use more threads than cores,
+        # but never more than the session's connection pool can serve at once.
+        self.concurrency = self.config.gitlab_concurrency or min(_POOL_SIZE, 3 * (os.cpu_count() or 1))
+
+    @staticmethod
+    def _build_session() -> "requests.Session":
+        """
+        A requests session whose keep-alive pool holds _POOL_SIZE connections per host.
+
+        Idempotent requests that hit a connection error or a transient status are retried
+        with exponential backoff; everything else is returned or raised after one attempt.
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        retry = Retry(
+            total=_RETRY_TOTAL,
+            backoff_factor=_RETRY_BACKOFF,
+            status_forcelist=_RETRY_STATUSES,
+            allowed_methods=_RETRY_METHODS,
+            # Hand the last transient response back so python-gitlab raises its usual error for it
+            raise_on_status=False,
+        )
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE, max_retries=retry)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
     @property
-    def project(self) -> Project:
-        """Lazy loads the project object."""
-        if self._project is None:
-            try:
-                self._project = self.gl.projects.get(self.project_id)
-            except gitlab.GitlabGetError as e:
-                logger.error(f"Failed to get project {self.project_id}: {e}")
-                raise RuntimeError(f"Failed to get project {self.project_id}: {e}") from e
-        return self._project
+    def project(self) -> "Project":
+        """Lazy loads the project object. Thread-safe: concurrent first accesses share one API call."""
+        project = self._project
+        if project is None:
+            with self._project_lock:
+                # Another thread may have loaded it while this one waited for the lock
+                project = self._project
+                if project is None:
+                    try:
+                        project = self._project = self.gl.projects.get(self.project_id)
+                    except gitlab.GitlabGetError as e:
+                        logger.error(f"Failed to get project {self.project_id}: {e}")
+                        raise RuntimeError(f"Failed to get project {self.project_id}: {e}") from e
+        return project
 
     def create_merge_request(self, source_branch: str, target_branch: str, title: str, description: str) -> int:
         """Creates a merge request."""
@@ -97,6 +178,31 @@ class GitLabProvider(GitProvider):
             logger.error(f"Failed to create tag {tag_name}: {e}")
             raise RuntimeError(f"Failed to create tag {tag_name}: {e}") from e
 
+    def create_tags(self, tags: Sequence[Tuple[str, str, str]]) -> None:
+        """
+        Creates several git tags concurrently.
+
+        Args:
+            tags: (tag_name, ref, message) for each tag, as for create_tag.
+
+        Raises:
+            RuntimeError: Naming every tag that could not be created; the others are still created.
+        """
+        if not tags:
+            return
+        logger.info(f"Creating {len(tags)} tags")
+        project = self.project
+        failures = self._for_each_concurrently(
+            lambda tag: project.tags.create({"tag_name": tag[0], "ref": tag[1], "message": tag[2]}),
+            tags,
+            gitlab.GitlabCreateError,
+        )
+        if failures:
+            details = "; ".join(f"{tag[0]}: {e}" for tag, e in failures)
+            logger.error(f"Failed to create tags: {details}")
+            raise RuntimeError(f"Failed to create tags: {details}")
+        logger.info(f"{len(tags)} tags created successfully")
+
     def get_last_tag(self) -> Optional[str]:
         """Retrieves the latest tag from the repository."""
         try:
@@ -119,6 +225,47 @@ class GitLabProvider(GitProvider):
             logger.error(f"Failed to post comment to MR {mr_id}: {e}")
             raise RuntimeError(f"Failed to post comment to MR {mr_id}: {e}") from e
 
+    def post_comments(self, mr_id: int, bodies: Sequence[str]) -> None:
+        """
+        Posts several comments to a merge request concurrently.
+
+        GitLab orders notes by creation time, so the comments may not appear in the given order.
+
+        Raises:
+            RuntimeError: If the merge request can't be loaded, or naming every comment that failed to post.
+        """
+        if not bodies:
+            return
+        logger.info(f"Posting {len(bodies)} comments to MR {mr_id}")
+        try:
+            mr = self.project.mergerequests.get(mr_id)
+        except gitlab.GitlabGetError as e:
+            logger.error(f"Failed to post comments to MR {mr_id}: {e}")
+            raise RuntimeError(f"Failed to post comments to MR {mr_id}: {e}") from e
+        numbered = list(enumerate(bodies, start=1))
+        failures = self._for_each_concurrently(
+            lambda comment: mr.notes.create({"body": comment[1]}), numbered, gitlab.GitlabCreateError
+        )
+        if failures:
+            details = "; ".join(f"comment {comment[0]}: {e}" for comment, e in failures)
+            logger.error(f"Failed to post comments to MR {mr_id}: {details}")
+            raise RuntimeError(f"Failed to post comments to MR {mr_id}: {details}")
+        logger.info(f"{len(bodies)} comments posted to MR {mr_id}")
+
+    def _for_each_concurrently(
+        self, action: Callable[[T], object], items: Sequence[T], error: Type[Exception]
+    ) -> List[Tuple[T, Exception]]:
+        """Runs action on every item on a thread pool; returns the (item, exception) pairs that raised `error`."""
+        failures: List[Tuple[T, Exception]] = []
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, len(items))) as pool:
+            futures = [pool.submit(action, item) for item in items]
+            for item, future in zip(items, futures, strict=True):
+                try:
+                    future.result()
+                except error as e:
+                    failures.append((item, e))
+        return failures
+
     def get_merge_request_status(self, mr_id: int) -> str:
         """Gets the status of a merge request."""
         try:
@@ -10,7 +10,7 @@
 
 import json
 import urllib.parse
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import httpx
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
@@ -23,12 +23,13 @@ from coreason_publisher.utils.logger import logger
 class HttpAssayClient(AssayClient):
     """HTTP-based implementation of the AssayClient."""
 
-    def __init__(self, config: PublisherConfig):
+    def __init__(self, config: PublisherConfig, transport: Optional[httpx.BaseTransport] = None):
         """
         Initialize the HttpAssayClient.
 
         Args:
             config: The publisher configuration object.
+            transport: Optional httpx transport for the session (e.g. ``httpx.MockTransport`` in tests).
         """
         self.config = config
 
@@ -42,6 +43,11 @@ class HttpAssayClient(AssayClient):
 
         # Normalize base_url to not have a trailing slash for easier concatenation
         self.base_url = self.config.assay_api_url.rstrip("/")
+        self._session = httpx.Client(timeout=30.0, transport=transport)
+
+    def close(self) -> None:
+        """Closes the underlying HTTP session and its pooled connections."""
+        self._session.close()
 
     @retry(
         stop=stop_after_attempt(3),
@@ -77,22 +83,21 @@ class HttpAssayClient(AssayClient):
         }
 
         try:
-            with httpx.Client() as client:
-                response = client.get(url, headers=headers, timeout=30.0)
-                response.raise_for_status()
-
-                try:
-                    data = response.json()
-                except json.JSONDecodeError as e:
-                    logger.error(f"Invalid JSON response: {response.text[:200]}")
-                    raise RuntimeError("Invalid JSON response from server") from e
-
-                if not isinstance(data, dict):
-                    logger.error(f"Unexpected response format: expected dict, got {type(data)}")
-                    raise RuntimeError(f"Unexpected response format: expected dict, got {type(data).__name__}")
-
-                logger.info("Successfully retrieved assay report")
-                return data
+            response = self._session.get(url, headers=headers)
+            response.raise_for_status()
+
+            try:
+                data = response.json()
+            except json.JSONDecodeError as e:
+                logger.error(f"Invalid JSON response: {response.text[:200]}")
+                raise RuntimeError("Invalid JSON response from server") from e
+
+            if not isinstance(data, dict):
+                logger.error(f"Unexpected response format: expected dict, got {type(data)}")
+                raise RuntimeError(f"Unexpected response format: expected dict, got {type(data).__name__}")
+
+            logger.info("Successfully retrieved assay report")
+            return data
 
         except httpx.HTTPStatusError as e:
             # Don't retry on 4xx errors (except maybe 429 which we aren't explicitly checking for yet,
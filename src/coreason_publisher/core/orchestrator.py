@@ -51,6 +51,10 @@ class PublisherOrchestrator:
         self.electronic_signer = electronic_signer
         self.version_manager = version_manager
 
+    def close(self) -> None:
+        """Releases the resources held by the orchestrator's clients (e.g. pooled HTTP sessions)."""
+        self.assay_client.close()
+
     def propose_release(
         self,
         project_id: str,
@@ -189,6 +189,8 @@ def propose(
         logger.exception("Propose failed")
         typer.secho(f"Error: {e}", fg=typer.colors.RED)
         raise typer.Exit(code=1) from e
+    finally:
+        orchestrator.close()
 
 
 @app.command()
@@ -210,6 +212,8 @@ def release(
         logger.exception("Release failed")
         typer.secho(f"Error: {e}", fg=typer.colors.RED)
         raise typer.Exit(code=1) from e
+    finally:
+        orchestrator.close()
 
 
 @app.command()
@@ -231,6 +235,8 @@ def reject(
         logger.exception("Reject failed")
         typer.secho(f"Error: {e}", fg=typer.colors.RED)
         raise typer.Exit(code=1) from e
+    finally:
+        orchestrator.close()
 
 
 def main() -> None:
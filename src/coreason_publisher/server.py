@@ -29,7 +29,7 @@ from coreason_publisher.utils.logger import logger
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """
-    Initialize the PublisherOrchestrator on startup.
+    Initialize the PublisherOrchestrator on startup and release its clients on shutdown.
     """
     logger.info("Initializing PublisherOrchestrator...")
     # Initialize with default config (from env) and cwd as workspace
@@ -44,6 +44,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         raise
     yield
     logger.info("Shutting down PublisherOrchestrator...")
+    orchestrator.close()
 
 
 app = FastAPI(
@@ -1,6 +1,19 @@
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List
+from unittest.mock import MagicMock
+
 import pytest
 from coreason_identity.models import UserContext
 
+# Bundler components are imported inside the fixtures below so that collecting
+# unrelated test modules doesn't pay for importing the bundler stack.
+if TYPE_CHECKING:
+    from typer.testing import CliRunner
+
+    from coreason_publisher.config import PublisherConfig
+    from coreason_publisher.core.artifact_bundler import ArtifactBundler
+
 
 @pytest.fixture
 def mock_user_context() -> UserContext:
@@ -12,3 +25,146 @@ def mock_user_context() -> UserContext:
         claims={"sub": "test_user"},
         downstream_token="fake-token",
     )
+
+
+@pytest.fixture(scope="session")
+def cli_runner() -> "CliRunner":
+    """One Typer runner for the session; it holds no per-invocation state."""
+    from typer.testing import CliRunner
+
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def spec_mock() -> Callable[[type], MagicMock]:
+    """
+    Factory for spec'd mocks that introspects each spec class only once per session.
+
+    ``MagicMock(spec=cls)`` walks ``dir(cls)`` (and checks every attribute for coroutines)
+    on each construction. Passing the cached attribute list instead keeps the same
+    attribute restriction while every call still returns a fresh, independent mock.
+    ``spec_set`` also rejects assignments to attributes the real class doesn't have,
+    so a typo in a test's mock setup fails loudly instead of configuring nothing.
+    """
+    attributes: Dict[type, List[str]] = {}
+
+    def factory(spec: type) -> MagicMock:
+        if spec not in attributes:
+            attributes[spec] = dir(spec)
+        return MagicMock(spec_set=attributes[spec])
+
+    return factory
+
+
+@pytest.fixture
+def sized_stat() -> Callable[[Path, int], Callable[..., os.stat_result]]:
+    """
+    Builds a ``Path.stat`` replacement that reports a fake size for a single file.
+
+    The target is matched by inode first, so every other stat call costs one real stat plus
+    an int compare, and then by resolved path, so a recycled inode number can't be mistaken
+    for it. The faked result is a real ``os.stat_result`` carrying every other attribute of
+    the file's own stat (mode, float timestamps, block counts), so ``is_file()`` keeps working.
+    """
+    original_stat = Path.stat
+
+    def build(target: Path, size: int) -> Callable[..., os.stat_result]:
+        target_ino = original_stat(target).st_ino
+        target_path = os.path.realpath(target)
+
+        def stat(self: Path, *args: Any, **kwargs: Any) -> os.stat_result:
+            st = original_stat(self, *args, **kwargs)
+            if st.st_ino != target_ino or os.path.realpath(self) != target_path:
+                return st
+            fields = list(st)
+            fields[6] = size  # st_size
+            return os.stat_result(fields, {name: getattr(st, name) for name in dir(st) if name.startswith("st_")})
+
+        return stat
+
+    return build
+
+
+@pytest.fixture(scope="session")
+def dir_entries() -> Callable[[Path], Dict[str, os.DirEntry[str]]]:
+    """
+    Lists a directory in one ``os.scandir`` pass, keyed by entry name.
+
+    Lets tests assert on several files in a directory without issuing one stat per
+    ``Path.exists()`` check.
+    """
+
+    def scan(path: Path) -> Dict[str, os.DirEntry[str]]:
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it}
+
+    return scan
+
+
+# --- ArtifactBundler fixtures (shared by the test_artifact_bundler* modules) ---
+
+
+@pytest.fixture
+def mock_config() -> "PublisherConfig":
+    from coreason_publisher.config import PublisherConfig
+
+    return PublisherConfig(lfs_threshold_mb=100, remote_storage_threshold_mb=70 * 1024)
+
+
+@pytest.fixture
+def mock_git_lfs(spec_mock: Callable[[type], MagicMock]) -> MagicMock:
+    from coreason_publisher.core.git_lfs import GitLFS
+
+    lfs = spec_mock(GitLFS)
+    lfs.is_installed.return_value = True
+    lfs.is_initialized.return_value = True
+    lfs.find_large_files.return_value = []
+    return lfs
+
+
+@pytest.fixture
+def mock_council_snapshot(spec_mock: Callable[[type], MagicMock]) -> MagicMock:
+    from coreason_publisher.core.council_snapshot import CouncilSnapshot
+
+    return spec_mock(CouncilSnapshot)
+
+
+@pytest.fixture
+def mock_storage_provider(spec_mock: Callable[[type], MagicMock]) -> MagicMock:
+    from coreason_publisher.core.remote_storage import MockStorageProvider
+
+    return spec_mock(MockStorageProvider)
+
+
+@pytest.fixture
+def mock_certificate_generator(spec_mock: Callable[[type], MagicMock]) -> MagicMock:
+    from coreason_publisher.core.certificate_generator import CertificateGenerator
+
+    mock = spec_mock(CertificateGenerator)
+    mock.generate.return_value = "# Certificate of Analysis\n\nPASSED"
+    return mock
+
+
+@pytest.fixture
+def artifact_bundler(
+    mock_config: "PublisherConfig",
+    mock_git_lfs: MagicMock,
+    mock_council_snapshot: MagicMock,
+    mock_storage_provider: MagicMock,
+    mock_certificate_generator: MagicMock,
+) -> "ArtifactBundler":
+    from coreason_publisher.core.artifact_bundler import ArtifactBundler
+
+    return ArtifactBundler(
+        mock_config, mock_git_lfs, mock_council_snapshot, mock_storage_provider, mock_certificate_generator
+    )
+
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> Path:
+    """A bundle-ready workspace: the root directory plus an empty evidence/assay_report.json."""
+    ws = tmp_path / "workspace"
+    evidence = ws / "evidence"
+    evidence.mkdir(parents=True)
+    (evidence / "assay_report.json").write_text("{}")
+    return ws
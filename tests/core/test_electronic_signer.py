@@ -8,6 +8,7 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_publisher
 
+import hashlib
 import json
 from pathlib import Path
 from unittest.mock import patch
@@ -90,6 +91,15 @@ def test_calculate_bundle_hash_excludes_git(signer: ElectronicSigner, tmp_path:
     assert hash1 == hash2
 
 
+def test_calculate_bundle_hash_multi_chunk_file(signer: ElectronicSigner, tmp_path: Path) -> None:
+    """Test that a file spanning several read chunks hashes exactly as its path + full content."""
+    content = bytes(range(256)) * (5 * 4096 + 7)  # ~5 MiB, not a multiple of the chunk size
+    (tmp_path / "model.bin").write_bytes(content)
+
+    expected = hashlib.sha256(b"model.bin" + content).hexdigest()
+    assert signer.calculate_bundle_hash(tmp_path) == expected
+
+
 def test_calculate_bundle_hash_missing_path(signer: ElectronicSigner, tmp_path: Path) -> None:
     """Test that hashing a non-existent path raises FileNotFoundError."""
     with pytest.raises(FileNotFoundError):
@@ -9,6 +9,7 @@
 # Source Code: https://github.com/CoReason-AI/coreason_publisher
 
 import json
+from collections.abc import Generator
 from unittest.mock import patch
 
 import httpx
@@ -21,10 +22,17 @@ from coreason_publisher.config import PublisherConfig
 from coreason_publisher.core.http_foundry_client import HttpFoundryClient
 
 
+@pytest.fixture(scope="module")
+def foundry_env() -> Generator[None, None, None]:
+    """Sets the Foundry env vars once for the module (the function-scoped monkeypatch can't be shared)."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("FOUNDRY_API_URL", "https://api.foundry.com")
+        mp.setenv("FOUNDRY_API_TOKEN", "test-token")
+        yield
+
+
 @pytest.fixture
-def client(monkeypatch: pytest.MonkeyPatch) -> HttpFoundryClient:
-    monkeypatch.setenv("FOUNDRY_API_URL", "https://api.foundry.com")
-    monkeypatch.setenv("FOUNDRY_API_TOKEN", "test-token")
+def client(foundry_env: None) -> HttpFoundryClient:
     config = PublisherConfig()
     return HttpFoundryClient(config)
 
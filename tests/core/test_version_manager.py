@@ -9,7 +9,7 @@
 # Source Code: https://github.com/CoReason-AI/coreason_publisher
 
 from pathlib import Path
-from typing import Generator
+from typing import Generator, Optional
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -29,45 +29,47 @@ def version_manager(mock_git_provider: MagicMock) -> Generator[VersionManager, N
 
 
 class TestVersionManager:
-    def test_calculate_next_version_initial(self, version_manager: VersionManager) -> None:
-        """Test calculation when no previous version exists."""
-        assert version_manager.calculate_next_version(None, BumpType.MINOR) == "v0.1.0"
-        assert version_manager.calculate_next_version(None, BumpType.MAJOR) == "v0.1.0"
-        assert version_manager.calculate_next_version(None, BumpType.PATCH) == "v0.1.0"
-        # Empty string should also default
-        assert version_manager.calculate_next_version("", BumpType.PATCH) == "v0.1.0"
-
-    def test_calculate_next_version_patch(self, version_manager: VersionManager) -> None:
-        assert version_manager.calculate_next_version("v1.0.0", BumpType.PATCH) == "v1.0.1"
-        assert version_manager.calculate_next_version("1.0.0", BumpType.PATCH) == "v1.0.1"
-
-    def test_calculate_next_version_minor(self, version_manager: VersionManager) -> None:
-        assert version_manager.calculate_next_version("v1.0.5", BumpType.MINOR) == "v1.1.0"
-        assert version_manager.calculate_next_version("0.1.0", BumpType.MINOR) == "v0.2.0"
-
-    def test_calculate_next_version_major(self, version_manager: VersionManager) -> None:
-        assert version_manager.calculate_next_version("v1.5.9", BumpType.MAJOR) == "v2.0.0"
-        assert version_manager.calculate_next_version("0.1.0", BumpType.MAJOR) == "v1.0.0"
-
-    def test_calculate_next_version_invalid(self, version_manager: VersionManager) -> None:
-        """Test that invalid version formats raise ValueError."""
-        invalid_versions = [
+    @pytest.mark.parametrize(
+        "current, bump, expected",
+        [
+            # No previous version (or an empty one) always defaults to v0.1.0
+            (None, BumpType.MINOR, "v0.1.0"),
+            (None, BumpType.MAJOR, "v0.1.0"),
+            (None, BumpType.PATCH, "v0.1.0"),
+            ("", BumpType.PATCH, "v0.1.0"),
+            ("v1.0.0", BumpType.PATCH, "v1.0.1"),
+            ("1.0.0", BumpType.PATCH, "v1.0.1"),
+            ("v1.0.5", BumpType.MINOR, "v1.1.0"),
+            ("0.1.0", BumpType.MINOR, "v0.2.0"),
+            ("v1.5.9", BumpType.MAJOR, "v2.0.0"),
+            ("0.1.0", BumpType.MAJOR, "v1.0.0"),
+            # Large version numbers
+            ("v99.99.99", BumpType.PATCH, "v99.99.100"),
+            ("v99.99.99", BumpType.MINOR, "v99.100.0"),
+            ("v99.99.99", BumpType.MAJOR, "v100.0.0"),
+            ("v2023.12.31", BumpType.PATCH, "v2023.12.32"),
+        ],
+    )
+    def test_calculate_next_version(
+        self, version_manager: VersionManager, current: Optional[str], bump: BumpType, expected: str
+    ) -> None:
+        """Test semantic version bumps, including the initial default and large numbers."""
+        assert version_manager.calculate_next_version(current, bump) == expected
+
+    @pytest.mark.parametrize(
+        "current",
+        [
             "invalid",
             "v1.0",  # Missing patch
             "1",  # Missing minor/patch
             "v1.0.0-beta",  # Non-integer components (basic implementation limitation)
             "v1.0.a",
-        ]
-        for v in invalid_versions:
-            with pytest.raises(ValueError):
-                version_manager.calculate_next_version(v, BumpType.PATCH)
-
-    def test_calculate_next_version_large_numbers(self, version_manager: VersionManager) -> None:
-        """Test bumping with large version numbers."""
-        assert version_manager.calculate_next_version("v99.99.99", BumpType.PATCH) == "v99.99.100"
-        assert version_manager.calculate_next_version("v99.99.99", BumpType.MINOR) == "v99.100.0"
-        assert version_manager.calculate_next_version("v99.99.99", BumpType.MAJOR) == "v100.0.0"
-        assert version_manager.calculate_next_version("v2023.12.31", BumpType.PATCH) == "v2023.12.32"
+        ],
+    )
+    def test_calculate_next_version_invalid(self, version_manager: VersionManager, current: str) -> None:
+        """Test that invalid version formats raise ValueError."""
+        with pytest.raises(ValueError):
+            version_manager.calculate_next_version(current, BumpType.PATCH)
 
     def test_get_current_version_tags(
         self, version_manager: VersionManager, mock_git_provider: MagicMock, tmp_path: Path
@@ -8,65 +8,25 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_publisher
 
+import os
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable, Dict
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from coreason_publisher.config import PublisherConfig
-from coreason_publisher.core.artifact_bundler import ArtifactBundler
-from coreason_publisher.core.certificate_generator import CertificateGenerator
-from coreason_publisher.core.council_snapshot import CouncilSnapshot
-from coreason_publisher.core.git_lfs import GitLFS
-from coreason_publisher.core.remote_storage import MockStorageProvider
+# The components under test are built by the lazy-importing fixtures in conftest.py; they are
+# only needed here for annotations, so collecting this module doesn't import the bundler stack.
+if TYPE_CHECKING:
+    from coreason_publisher.config import PublisherConfig
+    from coreason_publisher.core.artifact_bundler import ArtifactBundler
 
 
-@pytest.fixture
-def mock_config() -> PublisherConfig:
-    return PublisherConfig(lfs_threshold_mb=100, remote_storage_threshold_mb=70 * 1024)
-
-
-@pytest.fixture
-def mock_git_lfs() -> MagicMock:
-    lfs = MagicMock(spec=GitLFS)
-    lfs.is_installed.return_value = True
-    lfs.is_initialized.return_value = True
-    lfs.find_large_files.return_value = []
-    return lfs
-
-
-@pytest.fixture
-def mock_council_snapshot() -> MagicMock:
-    return MagicMock(spec=CouncilSnapshot)
-
-
-@pytest.fixture
-def mock_storage_provider() -> MagicMock:
-    return MagicMock(spec=MockStorageProvider)
-
-
-@pytest.fixture
-def mock_certificate_generator() -> MagicMock:
-    mock = MagicMock(spec=CertificateGenerator)
-    mock.generate.return_value = "# Certificate of Analysis\n\nPASSED"
-    return mock
-
-
-@pytest.fixture
-def artifact_bundler(
-    mock_config: PublisherConfig,
-    mock_git_lfs: MagicMock,
-    mock_council_snapshot: MagicMock,
-    mock_storage_provider: MagicMock,
-    mock_certificate_generator: MagicMock,
-) -> ArtifactBundler:
-    return ArtifactBundler(
-        mock_config, mock_git_lfs, mock_council_snapshot, mock_storage_provider, mock_certificate_generator
-    )
-
-
-def test_move_model_artifacts(artifact_bundler: ArtifactBundler, tmp_path: Path) -> None:
+def test_move_model_artifacts(
+    artifact_bundler: "ArtifactBundler",
+    dir_entries: Callable[[Path], Dict[str, os.DirEntry[str]]],
+    tmp_path: Path,
+) -> None:
     """Test that allow-listed model artifacts are moved to models/distilled/."""
     # Setup workspace
     workspace = tmp_path / "workspace"
@@ -95,26 +55,23 @@ def test_move_model_artifacts(artifact_bundler: ArtifactBundler, tmp_path: Path)
     # Run bundler method directly
     artifact_bundler._move_model_artifacts(workspace)
 
-    distilled = workspace / "models" / "distilled"
+    distilled = dir_entries(workspace / "models" / "distilled")
+    root = dir_entries(workspace)
 
     # Verify moves
-    assert (distilled / "adapter_config.json").exists()
-    assert (distilled / "model.safetensors").exists()
-    assert (distilled / "weights.bin").exists()
-    assert (distilled / "model.pt").exists()
+    assert {"adapter_config.json", "model.safetensors", "weights.bin", "model.pt"} <= distilled.keys()
 
-    assert not (workspace / "adapter_config.json").exists()
-    assert not (workspace / "model.safetensors").exists()
+    assert "adapter_config.json" not in root
+    assert "model.safetensors" not in root
 
     # Verify ignored
-    assert (workspace / "README.md").exists()
-    assert (workspace / "other.json").exists()
-    assert (workspace / "models" / "existing.bin").exists()
-    assert (workspace / "tests" / "test_model.bin").exists()
-    assert (workspace / ".git" / "config").exists()
+    assert {"README.md", "other.json"} <= root.keys()
+    assert "existing.bin" in dir_entries(workspace / "models")
+    assert "test_model.bin" in dir_entries(workspace / "tests")
+    assert "config" in dir_entries(workspace / ".git")
 
 
-def test_move_model_artifacts_overwrite(artifact_bundler: ArtifactBundler, tmp_path: Path) -> None:
+def test_move_model_artifacts_overwrite(artifact_bundler: "ArtifactBundler", tmp_path: Path) -> None:
     """Test overwriting existing files in distilled directory."""
     workspace = tmp_path / "workspace"
     workspace.mkdir()
@@ -134,14 +91,17 @@ def test_move_model_artifacts_overwrite(artifact_bundler: ArtifactBundler, tmp_p
 
 
 def test_handle_remote_storage(
-    artifact_bundler: ArtifactBundler, mock_storage_provider: MagicMock, tmp_path: Path
+    artifact_bundler: "ArtifactBundler",
+    mock_storage_provider: MagicMock,
+    sized_stat: Callable[[Path, int], Callable[..., os.stat_result]],
+    tmp_path: Path,
 ) -> None:
     """Test that files > 70GB are replaced by pointers."""
     workspace = tmp_path / "workspace"
     workspace.mkdir()
 
     large_file = workspace / "huge_model.bin"
-    large_file.write_text("dummy content")
+    large_file.touch()
 
     # Create a small file that shouldn't be touched
     small_file = workspace / "small_model.bin"
@@ -155,25 +115,9 @@ def test_handle_remote_storage(
     mock_storage_provider.upload.return_value = "hash-123"
 
     # Patch pathlib.Path.stat to return a large size for our specific file
-    original_stat = Path.stat
+    stat = sized_stat(large_file, 70 * 1024 * 1024 * 1024 + 1)
 
-    # Use string comparison to avoid recursion in resolve()
-    target_path_str = str(large_file.absolute())
-
-    def side_effect(self: Path, *args: Any, **kwargs: Any) -> object:
-        try:
-            # Avoid resolve(), use absolute() which is just string manipulation mostly
-            if str(self.absolute()) == target_path_str:
-                real_stat = original_stat(self, *args, **kwargs)
-                m = MagicMock()
-                m.st_size = 70 * 1024 * 1024 * 1024 + 1
-                m.st_mode = real_stat.st_mode
-                return m
-        except Exception:
-            pass
-        return original_stat(self, *args, **kwargs)
-
-    with patch("pathlib.Path.stat", side_effect=side_effect, autospec=True):
+    with patch.object(Path, "stat", new=stat):
         artifact_bundler._handle_remote_storage(workspace)
 
     mock_storage_provider.upload.assert_called_once_with(large_file)
@@ -182,14 +126,17 @@ def test_handle_remote_storage(
     content = large_file.read_text()
     assert content == "pointer:hash-123\n"
 
-    # Verify small file untouched
-    assert small_file.read_text() == "small content"
+    # Verify small file untouched (a pointer would have a different size)
+    assert small_file.stat().st_size == len("small content")
     # Verify .git untouched
-    assert (workspace / ".git" / "big_object").read_text() == "should be ignored"
+    assert (workspace / ".git" / "big_object").stat().st_size == len("should be ignored")
 
 
 def test_handle_remote_storage_configurable(
-    artifact_bundler: ArtifactBundler, mock_config: PublisherConfig, mock_storage_provider: MagicMock, tmp_path: Path
+    artifact_bundler: "ArtifactBundler",
+    mock_config: "PublisherConfig",
+    mock_storage_provider: MagicMock,
+    tmp_path: Path,
 ) -> None:
     """Test that remote storage threshold is configurable."""
     # Set config to 50 bytes (50 / 1024 / 1024 MB approx)
@@ -202,9 +149,9 @@ def test_handle_remote_storage_configurable(
     workspace.mkdir()
 
     large_file = workspace / "large.bin"
-    # Create file > 1MB
-    with open(large_file, "wb") as f:
-        f.write(b"\0" * (1024 * 1024 + 100))
+    # Create sparse file > 1MB
+    large_file.touch()
+    os.truncate(large_file, 1024 * 1024 + 100)
 
     mock_storage_provider.upload.return_value = "hash-123"
 
@@ -214,7 +161,7 @@ def test_handle_remote_storage_configurable(
 
 
 def test_handle_remote_storage_oserror(
-    artifact_bundler: ArtifactBundler, mock_storage_provider: MagicMock, tmp_path: Path
+    artifact_bundler: "ArtifactBundler", mock_storage_provider: MagicMock, tmp_path: Path
 ) -> None:
     """Test handling of OSError during file size check."""
     workspace = tmp_path / "workspace"
@@ -229,14 +176,14 @@ def test_handle_remote_storage_oserror(
             raise OSError("access denied")
         return original_stat(self, *args, **kwargs)
 
-    with patch("pathlib.Path.stat", side_effect=side_effect, autospec=True):
+    with patch.object(Path, "stat", new=side_effect):
         # Should not raise exception
         artifact_bundler._handle_remote_storage(workspace)
 
     mock_storage_provider.upload.assert_not_called()
 
 
-def test_configure_lfs(artifact_bundler: ArtifactBundler, mock_git_lfs: MagicMock, tmp_path: Path) -> None:
+def test_configure_lfs(artifact_bundler: "ArtifactBundler", mock_git_lfs: MagicMock, tmp_path: Path) -> None:
     """Test LFS configuration."""
     workspace = tmp_path / "workspace"
     workspace.mkdir()
@@ -255,7 +202,7 @@ def test_configure_lfs(artifact_bundler: ArtifactBundler, mock_git_lfs: MagicMoc
 
 
 def test_configure_lfs_uses_config(
-    artifact_bundler: ArtifactBundler, mock_config: PublisherConfig, mock_git_lfs: MagicMock, tmp_path: Path
+    artifact_bundler: "ArtifactBundler", mock_config: "PublisherConfig", mock_git_lfs: MagicMock, tmp_path: Path
 ) -> None:
     """Test LFS configuration uses the configured threshold."""
     workspace = tmp_path / "workspace"
@@ -270,7 +217,7 @@ def test_configure_lfs_uses_config(
 
 
 def test_configure_lfs_already_initialized(
-    artifact_bundler: ArtifactBundler, mock_git_lfs: MagicMock, tmp_path: Path
+    artifact_bundler: "ArtifactBundler", mock_git_lfs: MagicMock, tmp_path: Path
 ) -> None:
     """Test LFS configuration when already initialized."""
     workspace = tmp_path / "workspace"
@@ -286,7 +233,7 @@ def test_configure_lfs_already_initialized(
 
 
 def test_configure_lfs_not_installed(
-    artifact_bundler: ArtifactBundler, mock_git_lfs: MagicMock, tmp_path: Path
+    artifact_bundler: "ArtifactBundler", mock_git_lfs: MagicMock, tmp_path: Path
 ) -> None:
     """Test error when LFS not installed."""
     workspace = tmp_path / "workspace"
@@ -298,18 +245,13 @@ def test_configure_lfs_not_installed(
 
 
 def test_bundle_flow(
-    artifact_bundler: ArtifactBundler,
+    artifact_bundler: "ArtifactBundler",
     mock_git_lfs: MagicMock,
     mock_council_snapshot: MagicMock,
     mock_certificate_generator: MagicMock,
-    tmp_path: Path,
+    workspace: Path,
 ) -> None:
     """Test the full bundle flow."""
-    workspace = tmp_path / "workspace"
-    workspace.mkdir()
-    (workspace / "evidence").mkdir()
-    (workspace / "evidence" / "assay_report.json").write_text("{}")
-
     mock_git_lfs.is_initialized.return_value = True
 
     # Just ensure no errors are raised and calls are made
@@ -324,7 +266,7 @@ def test_bundle_flow(
     assert (workspace / "CERTIFICATE.md").read_text() == "# Certificate of Analysis\n\nPASSED"
 
 
-def test_bundle_flow_missing_workspace(artifact_bundler: ArtifactBundler, tmp_path: Path) -> None:
+def test_bundle_flow_missing_workspace(artifact_bundler: "ArtifactBundler", tmp_path: Path) -> None:
     """Test error when workspace missing."""
     workspace = tmp_path / "missing"
     with pytest.raises(FileNotFoundError):
@@ -332,16 +274,11 @@ def test_bundle_flow_missing_workspace(artifact_bundler: ArtifactBundler, tmp_pa
 
 
 def test_bundle_certificate_generation_error(
-    artifact_bundler: ArtifactBundler,
+    artifact_bundler: "ArtifactBundler",
     mock_certificate_generator: MagicMock,
-    tmp_path: Path,
+    workspace: Path,
 ) -> None:
     """Test that runtime error is raised if certificate generation fails."""
-    workspace = tmp_path / "workspace"
-    workspace.mkdir()
-    (workspace / "evidence").mkdir()
-    (workspace / "evidence" / "assay_report.json").write_text("{}")
-
     mock_certificate_generator.generate.side_effect = RuntimeError("Generation failed")
 
     with pytest.raises(RuntimeError, match="Failed to generate CERTIFICATE.md"):
@@ -349,16 +286,11 @@ def test_bundle_certificate_generation_error(
 
 
 def test_bundle_certificate_write_error(
-    artifact_bundler: ArtifactBundler,
+    artifact_bundler: "ArtifactBundler",
     mock_certificate_generator: MagicMock,
-    tmp_path: Path,
+    workspace: Path,
 ) -> None:
     """Test that runtime error is raised if certificate write fails."""
-    workspace = tmp_path / "workspace"
-    workspace.mkdir()
-    (workspace / "evidence").mkdir()
-    (workspace / "evidence" / "assay_report.json").write_text("{}")
-
     mock_certificate_generator.generate.return_value = "content"
 
     # Patch open to fail when writing CERTIFICATE.md
@@ -376,15 +308,11 @@ def test_bundle_certificate_write_error(
 
 
 def test_bundle_passes_correct_data_to_generator(
-    artifact_bundler: ArtifactBundler,
+    artifact_bundler: "ArtifactBundler",
     mock_certificate_generator: MagicMock,
-    tmp_path: Path,
+    workspace: Path,
 ) -> None:
     """Test that the exact data from assay_report.json is passed to the generator."""
-    workspace = tmp_path / "workspace"
-    workspace.mkdir()
-    (workspace / "evidence").mkdir()
-
     import json
 
     report_data = {"council": {"proposer": "me"}, "results": {"pass": True}}
@@ -8,62 +8,14 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_publisher
 
+import os
 from pathlib import Path
-from typing import Any
+from typing import Callable, Dict
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from coreason_publisher.config import PublisherConfig
 from coreason_publisher.core.artifact_bundler import ArtifactBundler
-from coreason_publisher.core.certificate_generator import CertificateGenerator
-from coreason_publisher.core.council_snapshot import CouncilSnapshot
-from coreason_publisher.core.git_lfs import GitLFS
-from coreason_publisher.core.remote_storage import MockStorageProvider
-
-
-@pytest.fixture
-def mock_config() -> PublisherConfig:
-    return PublisherConfig(lfs_threshold_mb=100, remote_storage_threshold_mb=70 * 1024)
-
-
-@pytest.fixture
-def mock_git_lfs() -> MagicMock:
-    lfs = MagicMock(spec=GitLFS)
-    lfs.is_installed.return_value = True
-    lfs.is_initialized.return_value = True
-    lfs.find_large_files.return_value = []
-    return lfs
-
-
-@pytest.fixture
-def mock_council_snapshot() -> MagicMock:
-    return MagicMock(spec=CouncilSnapshot)
-
-
-@pytest.fixture
-def mock_storage_provider() -> MagicMock:
-    return MagicMock(spec=MockStorageProvider)
-
-
-@pytest.fixture
-def mock_certificate_generator() -> MagicMock:
-    mock = MagicMock(spec=CertificateGenerator)
-    mock.generate.return_value = "MOCKED CERTIFICATE"
-    return mock
-
-
-@pytest.fixture
-def artifact_bundler(
-    mock_config: PublisherConfig,
-    mock_git_lfs: MagicMock,
-    mock_council_snapshot: MagicMock,
-    mock_storage_provider: MagicMock,
-    mock_certificate_generator: MagicMock,
-) -> ArtifactBundler:
-    return ArtifactBundler(
-        mock_config, mock_git_lfs, mock_council_snapshot, mock_storage_provider, mock_certificate_generator
-    )
 
 
 def test_move_model_artifacts_symlinks(artifact_bundler: ArtifactBundler, tmp_path: Path) -> None:
@@ -126,7 +78,9 @@ def test_complex_scenario(
     artifact_bundler: ArtifactBundler,
     mock_git_lfs: MagicMock,
     mock_storage_provider: MagicMock,
-    tmp_path: Path,
+    sized_stat: Callable[[Path, int], Callable[..., os.stat_result]],
+    dir_entries: Callable[[Path], Dict[str, os.DirEntry[str]]],
+    workspace: Path,
 ) -> None:
     """
     Test a complex scenario with:
@@ -135,18 +89,15 @@ def test_complex_scenario(
     - Small model file -> Moved
     - Ignored file -> Untouched
     """
-    workspace = tmp_path / "workspace"
-    workspace.mkdir()
-
     # 1. Ultra-large file
     ultra_large = workspace / "ultra_large.bin"
-    ultra_large.write_text("dummy")
+    ultra_large.touch()
     mock_storage_provider.upload.return_value = "remote-hash"
 
     # 2. Large file (LFS)
     # Note: .pt is in MODEL_EXTENSIONS, so it will be moved too!
     lfs_file = workspace / "large_file.pt"
-    lfs_file.write_text("dummy")
+    lfs_file.touch()
     mock_git_lfs.find_large_files.return_value = ["large_file.pt"]
 
     # 3. Small model to move
@@ -157,56 +108,46 @@ def test_complex_scenario(
     ignored = workspace / "README.md"
     ignored.touch()
 
-    # Patch stat for ultra-large file
-    original_stat = Path.stat
-    target_path_str = str(ultra_large.absolute())
-
-    def side_effect(self: Path, *args: Any, **kwargs: Any) -> object:
-        try:
-            if str(self.absolute()) == target_path_str:
-                m = MagicMock()
-                m.st_size = 70 * 1024 * 1024 * 1024 + 1
-                m.st_mode = original_stat(self).st_mode
-                return m
-        except Exception:
-            pass
-        return original_stat(self, *args, **kwargs)
-
-    with patch("pathlib.Path.stat", side_effect=side_effect, autospec=True):
-        # We need to manually call bundle components or just run bundle() if we mock council snapshot
-        # Let's run bundle() but we need evidence folder for snapshot
-        (workspace / "evidence").mkdir()
-        (workspace / "evidence" / "assay_report.json").write_text("{}")
+    # Report a >70GB size for the ultra-large file
+    stat = sized_stat(ultra_large, 70 * 1024 * 1024 * 1024 + 1)
 
+    with patch.object(Path, "stat", new=stat):
+        # The workspace fixture provides the evidence folder bundle() needs for the snapshot
         mock_git_lfs.is_initialized.return_value = False
 
         artifact_bundler.bundle(workspace)
 
+    distilled = dir_entries(workspace / "models" / "distilled")
+    root = dir_entries(workspace)
+
     # Verify Ultra-Large
     mock_storage_provider.upload.assert_called_with(ultra_large)
     # It should have been moved to distilled because it ends in .bin
-    distilled_ultra = workspace / "models" / "distilled" / "ultra_large.bin"
-    assert distilled_ultra.exists()
-    assert distilled_ultra.read_text() == "pointer:remote-hash\n"
-    assert not ultra_large.exists()
+    assert "ultra_large.bin" in distilled
+    assert Path(distilled["ultra_large.bin"].path).read_text() == "pointer:remote-hash\n"
+    assert ultra_large.name not in root
 
     # Verify LFS
     mock_git_lfs.initialize.assert_called_with(workspace)
     mock_git_lfs.track_patterns.assert_called_with(workspace, ["large_file.pt"])
 
     # Verify Move (Small & LFS file if moved)
-    distilled = workspace / "models" / "distilled"
-    assert (distilled / "small.safetensors").exists()
-    assert not small_model.exists()
+    assert "small.safetensors" in distilled
+    assert small_model.name not in root
 
     # Check if large_file.pt was moved (it is .pt so yes)
-    assert (distilled / "large_file.pt").exists()
+    assert "large_file.pt" in distilled
 
     # Verify Ignored
-    assert ignored.exists()
+    assert ignored.name in root
 
 
-def test_upload_failure(artifact_bundler: ArtifactBundler, mock_storage_provider: MagicMock, tmp_path: Path) -> None:
+def test_upload_failure(
+    artifact_bundler: ArtifactBundler,
+    mock_storage_provider: MagicMock,
+    sized_stat: Callable[[Path, int], Callable[..., os.stat_result]],
+    tmp_path: Path,
+) -> None:
     """Test that upload failure propagates."""
     workspace = tmp_path / "workspace"
     workspace.mkdir()
@@ -217,17 +158,8 @@ def test_upload_failure(artifact_bundler: ArtifactBundler, mock_storage_provider
     mock_storage_provider.upload.side_effect = RuntimeError("Upload failed")
 
     # Patch stat
-    original_stat = Path.stat
-    target_path_str = str(large_file.absolute())
-
-    def side_effect(self: Path, *args: Any, **kwargs: Any) -> object:
-        if str(self.absolute()) == target_path_str:
-            m = MagicMock()
-            m.st_size = 70 * 1024 * 1024 * 1024 + 1
-            m.st_mode = original_stat(self).st_mode
-            return m
-        return original_stat(self, *args, **kwargs)
-
-    with patch("pathlib.Path.stat", side_effect=side_effect, autospec=True):
+    stat = sized_stat(large_file, 70 * 1024 * 1024 * 1024 + 1)
+
+    with patch.object(Path, "stat", new=stat):
         with pytest.raises(RuntimeError, match="Upload failed"):
             artifact_bundler._handle_remote_storage(workspace)
@@ -9,184 +9,204 @@
 # Source Code: https://github.com/CoReason-AI/coreason_publisher
 
 from collections.abc import Generator
-from unittest import mock
+from typing import Any, Dict, List, NamedTuple, Optional, Type, Union
 
 import httpx
 import pytest
-import respx
+from pydantic import SecretStr
 
 from coreason_publisher.config import PublisherConfig
 from coreason_publisher.core.http_assay_client import HttpAssayClient
 
+ASSAY_API_URL = "https://api.assay.coreason.ai"
 
-@pytest.fixture
-def mock_env(monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
-    """Sets up environment variables for testing."""
-    monkeypatch.setenv("ASSAY_API_URL", "https://api.assay.coreason.ai")
-    monkeypatch.setenv("ASSAY_API_TOKEN", "test-token")
-    yield
-
-
-@pytest.fixture
-def publisher_config(mock_env: None) -> PublisherConfig:
-    return PublisherConfig()
-
-
-def test_init_raises_error_missing_env(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Test that __init__ raises ValueError if env vars are missing."""
-    monkeypatch.delenv("ASSAY_API_URL", raising=False)
-    monkeypatch.delenv("ASSAY_API_TOKEN", raising=False)
-
-    # Empty config
-    config = PublisherConfig()
-
-    with pytest.raises(ValueError, match="ASSAY_API_URL not set in config"):
-        HttpAssayClient(config)
-
-    monkeypatch.setenv("ASSAY_API_URL", "http://test")
-    config = PublisherConfig()
 
-    with pytest.raises(ValueError, match="ASSAY_API_TOKEN not set in config"):
-        HttpAssayClient(config)
+class Reply(NamedTuple):
+    """A canned Assay API response; the stub builds a fresh ``httpx.Response`` from it for every request."""
 
+    status_code: int
+    json: Any = None
+    text: Optional[str] = None
 
-def test_get_latest_report_success(publisher_config: PublisherConfig) -> None:
-    """Test successful retrieval of assay report."""
-    project_id = "test-project"
-    expected_data = {"id": "123", "status": "passed"}
 
-    with respx.mock(base_url="https://api.assay.coreason.ai") as respx_mock:
-        respx_mock.get(f"/projects/{project_id}/reports/latest").mock(
-            return_value=httpx.Response(200, json=expected_data)
-        )
+REPORT = {"id": "123", "status": "passed"}
+REPORT_REPLY = Reply(200, json=REPORT)
+EMPTY_REPORT_REPLY = Reply(200, json={})
 
-        client = HttpAssayClient(publisher_config)
-        data = client.get_latest_report(project_id)
 
-        assert data == expected_data
+def report_path(project_id: str) -> bytes:
+    """Raw (still percent-encoded) request path of the latest-report endpoint."""
+    return f"/projects/{project_id}/reports/latest".encode()
 
 
-def test_get_latest_report_404(publisher_config: PublisherConfig) -> None:
-    """Test retrieval when report is not found."""
-    project_id = "unknown-project"
+class StubAssayAPI:
+    """
+    ``httpx.MockTransport`` handler standing in for the Assay API.
 
-    with respx.mock(base_url="https://api.assay.coreason.ai") as respx_mock:
-        respx_mock.get(f"/projects/{project_id}/reports/latest").mock(
-            return_value=httpx.Response(404, json={"error": "Not Found"})
-        )
+    Tests map a raw request path to the reply to send, or the exception to raise;
+    every request is recorded so tests can check what was sent.
+    """
 
-        client = HttpAssayClient(publisher_config)
-        with pytest.raises(RuntimeError, match="Failed to retrieve assay report: 404"):
-            client.get_latest_report(project_id)
-
-
-def test_get_latest_report_500(publisher_config: PublisherConfig) -> None:
-    """Test retrieval when server errors."""
-    project_id = "test-project"
+    def __init__(self) -> None:
+        self.routes: Dict[bytes, Union[Reply, Exception]] = {}
+        self.requests: List[httpx.Request] = []
 
-    with respx.mock(base_url="https://api.assay.coreason.ai") as respx_mock:
-        respx_mock.get(f"/projects/{project_id}/reports/latest").mock(
-            return_value=httpx.Response(500, json={"error": "Server Error"})
-        )
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        outcome = self.routes[request.url.raw_path]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return httpx.Response(outcome.status_code, json=outcome.json, text=outcome.text)
 
-        client = HttpAssayClient(publisher_config)
-        # 500 triggers retry, so we expect it to fail after retries
-        with pytest.raises(httpx.HTTPStatusError):
-            client.get_latest_report(project_id)
 
+@pytest.fixture(scope="module")
+def assay_api() -> StubAssayAPI:
+    return StubAssayAPI()
 
-def test_get_latest_report_connection_error(publisher_config: PublisherConfig) -> None:
-    """Test retrieval when connection fails."""
-    project_id = "test-project"
 
-    with respx.mock(base_url="https://api.assay.coreason.ai") as respx_mock:
-        respx_mock.get(f"/projects/{project_id}/reports/latest").mock(
-            side_effect=httpx.ConnectError("Connection refused")
-        )
+@pytest.fixture(autouse=True)
+def reset_assay_api(assay_api: StubAssayAPI) -> Generator[None, None, None]:
+    """Drops the routes and requests a test left on the shared stub."""
+    yield
+    assay_api.routes.clear()
+    assay_api.requests.clear()
 
-        client = HttpAssayClient(publisher_config)
-        # Connection error triggers retry
-        with pytest.raises(httpx.ConnectError):
-            client.get_latest_report(project_id)
 
+@pytest.fixture(scope="module")
+def publisher_config() -> PublisherConfig:
+    """
+    One validated config for the whole module; tests that need a variant take a ``model_copy``.
 
-def test_get_latest_report_unexpected_error(publisher_config: PublisherConfig) -> None:
-    """Test retrieval when unexpected error occurs."""
-    project_id = "test-project"
+    The values are passed explicitly (rather than via env vars) so it can be built at module scope.
+    """
+    return PublisherConfig(assay_api_url=ASSAY_API_URL, assay_api_token=SecretStr("test-token"))
 
-    # Mock httpx.Client to raise a generic Exception
-    with mock.patch("httpx.Client", side_effect=Exception("Boom")):
-        client = HttpAssayClient(publisher_config)
-        with pytest.raises(RuntimeError, match="Unexpected error retrieving report"):
-            client.get_latest_report(project_id)
 
+@pytest.fixture(scope="module")
+def assay_client(publisher_config: PublisherConfig, assay_api: StubAssayAPI) -> Generator[HttpAssayClient, None, None]:
+    """One client, and so one keep-alive session, for the whole module, wired to the stub API."""
+    client = HttpAssayClient(publisher_config, transport=httpx.MockTransport(assay_api))
+    yield client
+    client.close()
 
-def test_get_latest_report_timeout(publisher_config: PublisherConfig) -> None:
-    """Test retrieval when request times out."""
-    project_id = "test-project"
 
-    with respx.mock(base_url="https://api.assay.coreason.ai") as respx_mock:
-        respx_mock.get(f"/projects/{project_id}/reports/latest").mock(side_effect=httpx.TimeoutException("Timeout"))
+@pytest.mark.parametrize(
+    "missing_field, expected",
+    [
+        ("assay_api_url", "ASSAY_API_URL not set in config"),
+        ("assay_api_token", "ASSAY_API_TOKEN not set in config"),
+    ],
+)
+def test_init_raises_error_missing_env(publisher_config: PublisherConfig, missing_field: str, expected: str) -> None:
+    """Test that __init__ raises ValueError if an assay setting is missing."""
+    config = publisher_config.model_copy(update={missing_field: None})
 
-        client = HttpAssayClient(publisher_config)
-        with pytest.raises(httpx.TimeoutException):
-            client.get_latest_report(project_id)
+    with pytest.raises(ValueError, match=expected):
+        HttpAssayClient(config)
 
 
-def test_get_latest_report_invalid_json(publisher_config: PublisherConfig) -> None:
-    """Test retrieval when server returns invalid JSON."""
+@pytest.mark.parametrize(
+    "response, raises, match",
+    [
+        pytest.param(REPORT_REPLY, None, None, id="success"),
+        # 4xx is not retried and surfaces as a RuntimeError
+        pytest.param(
+            Reply(404, json={"error": "Not Found"}),
+            RuntimeError,
+            "Failed to retrieve assay report: 404",
+            id="404",
+        ),
+        # 500 triggers retry, so we expect it to fail after retries
+        pytest.param(Reply(500, json={"error": "Server Error"}), httpx.HTTPStatusError, None, id="500"),
+    ],
+)
+def test_get_latest_report(
+    assay_client: HttpAssayClient,
+    assay_api: StubAssayAPI,
+    response: Reply,
+    raises: Optional[Type[Exception]],
+    match: Optional[str],
+) -> None:
+    """Test retrieval of the assay report for successful, not-found and server-error responses."""
     project_id = "test-project"
 
-    with respx.mock(base_url="https://api.assay.coreason.ai") as respx_mock:
-        respx_mock.get(f"/projects/{project_id}/reports/latest").mock(return_value=httpx.Response(200, text="Not JSON"))
-
-        client = HttpAssayClient(publisher_config)
-        with pytest.raises(RuntimeError, match="Invalid JSON response from server"):
-            client.get_latest_report(project_id)
-
-
-def test_get_latest_report_non_dict_response(publisher_config: PublisherConfig) -> None:
-    """Test retrieval when server returns a JSON list instead of a dict."""
+    assay_api.routes[report_path(project_id)] = response
+
+    if raises is None:
+        assert assay_client.get_latest_report(project_id) == REPORT
+    else:
+        with pytest.raises(raises, match=match):
+            assay_client.get_latest_report(project_id)
+
+
+@pytest.mark.parametrize(
+    "outcome, raises, match",
+    [
+        # Network errors and timeouts trigger retries before surfacing
+        pytest.param(httpx.ConnectError("Connection refused"), httpx.ConnectError, None, id="connection-error"),
+        pytest.param(httpx.TimeoutException("Timeout"), httpx.TimeoutException, None, id="timeout"),
+        pytest.param(Exception("Boom"), RuntimeError, "Unexpected error retrieving report", id="unexpected-error"),
+        pytest.param(Reply(200, text="Not JSON"), RuntimeError, "Invalid JSON response from server", id="invalid-json"),
+        pytest.param(
+            Reply(200, json=[{"id": "1"}]),
+            RuntimeError,
+            "Unexpected response format: expected dict, got list",
+            id="non-dict-response",
+        ),
+    ],
+)
+def test_get_latest_report_error(
+    assay_client: HttpAssayClient,
+    assay_api: StubAssayAPI,
+    outcome: Union[Reply, Exception],
+    raises: Type[Exception],
+    match: Optional[str],
+) -> None:
+    """Test retrieval when the request fails or the server returns an unusable body."""
     project_id = "test-project"
 
-    with respx.mock(base_url="https://api.assay.coreason.ai") as respx_mock:
-        respx_mock.get(f"/projects/{project_id}/reports/latest").mock(
-            return_value=httpx.Response(200, json=[{"id": "1"}])
-        )
+    assay_api.routes[report_path(project_id)] = outcome
 
-        client = HttpAssayClient(publisher_config)
-        with pytest.raises(RuntimeError, match="Unexpected response format: expected dict, got list"):
-            client.get_latest_report(project_id)
+    with pytest.raises(raises, match=match):
+        assay_client.get_latest_report(project_id)
 
 
-def test_get_latest_report_url_construction(mock_env: None, monkeypatch: pytest.MonkeyPatch) -> None:
+def test_get_latest_report_url_construction(publisher_config: PublisherConfig, assay_api: StubAssayAPI) -> None:
     """Test correct URL construction with trailing slashes."""
     project_id = "test-project"
 
-    # Test with trailing slash in env var
-    monkeypatch.setenv("ASSAY_API_URL", "https://api.assay.coreason.ai/")
-    config = PublisherConfig()
+    # Test with trailing slash in the configured URL
+    config = publisher_config.model_copy(update={"assay_api_url": "https://api.assay.coreason.ai/"})
 
-    client = HttpAssayClient(config)
+    client = HttpAssayClient(config, transport=httpx.MockTransport(assay_api))
     # Check internal base_url attribute is stripped
     assert client.base_url == "https://api.assay.coreason.ai"
 
-    with respx.mock(base_url="https://api.assay.coreason.ai") as respx_mock:
-        route = respx_mock.get(f"/projects/{project_id}/reports/latest").mock(return_value=httpx.Response(200, json={}))
+    assay_api.routes[report_path(project_id)] = EMPTY_REPORT_REPLY
 
-        client.get_latest_report(project_id)
-        assert route.called
+    client.get_latest_report(project_id)
+    client.close()
+    assert [str(request.url) for request in assay_api.requests] == [
+        "https://api.assay.coreason.ai/projects/test-project/reports/latest"
+    ]
 
 
-def test_get_latest_report_special_chars_project_id(publisher_config: PublisherConfig) -> None:
+def test_get_latest_report_special_chars_project_id(assay_client: HttpAssayClient, assay_api: StubAssayAPI) -> None:
     """Test that project ID is URL-encoded."""
     project_id = "group/subgroup/project"
-    encoded_id = "group%2Fsubgroup%2Fproject"
 
-    with respx.mock(base_url="https://api.assay.coreason.ai") as respx_mock:
-        # Expect the encoded URL
-        route = respx_mock.get(f"/projects/{encoded_id}/reports/latest").mock(return_value=httpx.Response(200, json={}))
+    # url.path is percent-decoded, so the stub routes on the raw path, which keeps the encoded slashes
+    assay_api.routes[report_path("group%2Fsubgroup%2Fproject")] = EMPTY_REPORT_REPLY
+
+    assay_client.get_latest_report(project_id)
+    assert len(assay_api.requests) == 1
+
+
+def test_close_closes_session(publisher_config: PublisherConfig, assay_api: StubAssayAPI) -> None:
+    """Test that close() shuts the pooled session, so no connections outlive the client."""
+    client = HttpAssayClient(publisher_config, transport=httpx.MockTransport(assay_api))
+    assert not client._session.is_closed
+
+    client.close()
 
-        client = HttpAssayClient(publisher_config)
-        client.get_latest_report(project_id)
-        assert route.called
+    assert client._session.is_closed
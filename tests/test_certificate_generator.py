@@ -8,30 +8,38 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_publisher
 
+import copy
+import importlib.resources
 from typing import Any, Dict
-from unittest.mock import patch
 
 import pytest
 
+from coreason_publisher.core import certificate_generator
 from coreason_publisher.core.certificate_generator import CertificateGenerator
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def generator() -> CertificateGenerator:
+    """Shared across the module so the template is loaded and compiled once."""
     return CertificateGenerator()
 
 
+# Shared by the tests that only read it; tests that mutate the report take the valid_report fixture.
+VALID_REPORT: Dict[str, Any] = {
+    "council": {"proposer": "gpt-4-0613", "judge": "claude-3-opus-20240229"},
+    "results": {"pass": True, "score": 98.5},
+}
+
+
 @pytest.fixture
 def valid_report() -> Dict[str, Any]:
-    return {
-        "council": {"proposer": "gpt-4-0613", "judge": "claude-3-opus-20240229"},
-        "results": {"pass": True, "score": 98.5},
-    }
+    """A private copy of VALID_REPORT for tests that modify it."""
+    return copy.deepcopy(VALID_REPORT)
 
 
-def test_generate_success(generator: CertificateGenerator, valid_report: Dict[str, Any]) -> None:
+def test_generate_success(generator: CertificateGenerator) -> None:
     """Test successful generation of CoA."""
-    cert = generator.generate(valid_report)
+    cert = generator.generate(VALID_REPORT)
 
     assert "# Certificate of Analysis" in cert
     assert "**Status:** PASSED" in cert
@@ -77,24 +85,44 @@ def test_template_loading(generator: CertificateGenerator) -> None:
     assert "Council Manifest" in content
 
 
-def test_load_template_failure(generator: CertificateGenerator, valid_report: Dict[str, Any]) -> None:
+def test_template_compiled_once(generator: CertificateGenerator) -> None:
+    """Test that the compiled template is cached on the generator."""
+    assert generator._get_template() is generator._get_template()
+
+
+def test_load_template_failure(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test failure during template loading."""
-    with patch("importlib.resources.files", side_effect=Exception("Resource error")):
-        with pytest.raises(RuntimeError, match="Failed to load template: Resource error"):
-            generator.generate(valid_report)
 
+    def files(package: str) -> Any:
+        raise Exception("Resource error")
+
+    monkeypatch.setattr(importlib.resources, "files", files)
 
-def test_render_template_failure(generator: CertificateGenerator, valid_report: Dict[str, Any]) -> None:
+    # A fresh generator, since the shared one already holds a compiled template
+    generator = CertificateGenerator()
+    with pytest.raises(RuntimeError, match="Failed to load template: Resource error"):
+        generator.generate(VALID_REPORT)
+
+
+class _FailingTemplate:
+    """Stands in for jinja2.Template; compiles fine but fails to render."""
+
+    def __init__(self, source: str) -> None:
+        pass
+
+    def render(self, *args: Any, **kwargs: Any) -> str:
+        raise Exception("Render error")
+
+
+def test_render_template_failure(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test failure during template rendering."""
-    # We can mock Template class or the template object.
-    # Since we are not mocking load_template here, it returns a string.
-    # The Template constructor is called. We can mock jinja2.Template.
-    with patch("coreason_publisher.core.certificate_generator.Template") as mock_template_cls:
-        mock_template_instance = mock_template_cls.return_value
-        mock_template_instance.render.side_effect = Exception("Render error")
-
-        with pytest.raises(RuntimeError, match="Failed to render template: Render error"):
-            generator.generate(valid_report)
+    # Since we are not mocking load_template here, it returns a string and the
+    # Template constructor is called (on a fresh generator, so nothing is cached).
+    monkeypatch.setattr(certificate_generator, "Template", _FailingTemplate)
+
+    generator = CertificateGenerator()
+    with pytest.raises(RuntimeError, match="Failed to render template: Render error"):
+        generator.generate(VALID_REPORT)
 
 
 # --- Edge Case & Complex Scenario Tests ---
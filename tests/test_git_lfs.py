@@ -8,15 +8,35 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_publisher
 
+import os
 import re
 import subprocess
 from pathlib import Path
-from typing import cast
-from unittest.mock import MagicMock, patch
+from typing import Any, Callable, List
+from unittest.mock import MagicMock, mock_open, patch
 
 import pytest
 
-from coreason_publisher.core.git_lfs import GitLFS
+from coreason_publisher.core.git_lfs import _PROBE_TTL, GitLFS, _arg_budget
+
+# is_initialized and verify_ready share this single rev-parse call
+REV_PARSE_CMD = ["git", "rev-parse", "--is-inside-work-tree", "--git-path", "hooks"]
+
+
+def git_probes(rev_parse: List[MagicMock], lfs_env: List[MagicMock]) -> Callable[..., MagicMock]:
+    """
+    A subprocess.run side effect that answers the is_initialized probes by command.
+
+    is_initialized runs both probes at once, so their call order isn't fixed; each
+    list is consumed in order by its own command instead.
+    """
+    rev_parse_results = iter(rev_parse)
+    lfs_env_results = iter(lfs_env)
+
+    def run(cmd: List[str], **kwargs: Any) -> MagicMock:
+        return next(rev_parse_results if cmd[1] == "rev-parse" else lfs_env_results)
+
+    return run
 
 
 @pytest.fixture
@@ -34,6 +54,19 @@ def test_is_installed_false(git_lfs: GitLFS) -> None:
         assert git_lfs.is_installed() is False
 
 
+def test_is_installed_cached(git_lfs: GitLFS) -> None:
+    """Test that PATH is searched once per instance until the cache is invalidated."""
+    with patch("shutil.which", return_value=None) as mock_which:
+        assert git_lfs.is_installed() is False
+        assert git_lfs.is_installed() is False
+        assert mock_which.call_count == 1
+
+        mock_which.return_value = "/usr/bin/git-lfs"
+        git_lfs.invalidate_cache()
+        assert git_lfs.is_installed() is True
+        assert mock_which.call_count == 2
+
+
 def test_is_initialized_not_a_git_repo(git_lfs: GitLFS, tmp_path: Path) -> None:
     # tmp_path is just a directory, not a git repo
     assert git_lfs.is_initialized(tmp_path) is False
@@ -43,23 +76,23 @@ def test_is_initialized_success(git_lfs: GitLFS, tmp_path: Path) -> None:
     # We check 1. git rev-parse, 2. git lfs env
     # Patch subprocess.run where it is used
     with patch("coreason_publisher.core.git_lfs.subprocess.run") as mock_run:
-        mock_run.side_effect = [
-            MagicMock(returncode=0),
-            MagicMock(returncode=0, stdout="Endpoint=https://gitlab.com/repo/info/lfs"),
-        ]
+        mock_run.side_effect = git_probes(
+            [MagicMock(returncode=0)],
+            [MagicMock(returncode=0, stdout="Endpoint=https://gitlab.com/repo/info/lfs")],
+        )
         assert git_lfs.is_initialized(tmp_path) is True
         assert mock_run.call_count == 2
-        assert mock_run.call_args_list[0][0][0] == ["git", "rev-parse", "--is-inside-work-tree"]
-        assert mock_run.call_args_list[1][0][0] == ["git", "lfs", "env"]
+        commands = sorted(call_args[0][0] for call_args in mock_run.call_args_list)
+        assert commands == [["git", "lfs", "env"], REV_PARSE_CMD]
 
 
 def test_is_initialized_no_endpoint(git_lfs: GitLFS, tmp_path: Path) -> None:
     # Git lfs env succeeds, but no Endpoint configured
     with patch("coreason_publisher.core.git_lfs.subprocess.run") as mock_run:
-        mock_run.side_effect = [
-            MagicMock(returncode=0),
-            MagicMock(returncode=0, stdout="Git LFS v2.0.0 (GitHub; windows 386; go 1.8.3)\n"),
-        ]
+        mock_run.side_effect = git_probes(
+            [MagicMock(returncode=0)],
+            [MagicMock(returncode=0, stdout="Git LFS v2.0.0 (GitHub; windows 386; go 1.8.3)\n")],
+        )
         assert git_lfs.is_initialized(tmp_path) is False
 
 
@@ -73,10 +106,7 @@ def test_is_initialized_failure(git_lfs: GitLFS, tmp_path: Path) -> None:
 def test_is_initialized_lfs_failure(git_lfs: GitLFS, tmp_path: Path) -> None:
     # Fails at git lfs env
     with patch("coreason_publisher.core.git_lfs.subprocess.run") as mock_run:
-        mock_run.side_effect = [
-            MagicMock(returncode=0),
-            MagicMock(returncode=1, stderr="LFS error"),
-        ]
+        mock_run.side_effect = git_probes([MagicMock(returncode=0)], [MagicMock(returncode=1, stderr="LFS error")])
         assert git_lfs.is_initialized(tmp_path) is False
 
 
@@ -92,15 +122,15 @@ def test_initialize_success(git_lfs: GitLFS, tmp_path: Path) -> None:
         mock_run.assert_called_once_with(
             ["git", "lfs", "install"],
             cwd=tmp_path,
-            check=True,
-            capture_output=True,
-            text=True,
+            check=False,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
         )
 
 
 def test_initialize_failure(git_lfs: GitLFS, tmp_path: Path) -> None:
-    with patch("subprocess.run", side_effect=subprocess.CalledProcessError(1, "cmd", stderr="error")):
-        with pytest.raises(RuntimeError, match="Failed to initialize Git LFS"):
+    with patch("subprocess.run", return_value=MagicMock(returncode=1, stderr=b"error")):
+        with pytest.raises(RuntimeError, match="Failed to initialize Git LFS: error"):
             git_lfs.initialize(tmp_path)
 
 
@@ -118,12 +148,21 @@ def test_track_patterns_success(git_lfs: GitLFS, tmp_path: Path) -> None:
         mock_run.assert_called_once_with(
             ["git", "lfs", "track", "*.bin", "*.pt"],
             cwd=tmp_path,
-            check=True,
-            capture_output=True,
-            text=True,
+            check=False,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
         )
 
 
+def test_track_patterns_deduplicates(git_lfs: GitLFS, tmp_path: Path) -> None:
+    """Test that repeated patterns, e.g. from several groups, collapse into one argv entry each."""
+    groups = [["*.bin", "*.pt"], ["*.pt", "*.bin", "*.onnx"]]
+    with patch("subprocess.run", return_value=MagicMock(returncode=0)) as mock_run:
+        git_lfs.track_patterns(tmp_path, (pattern for group in groups for pattern in group))
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == ["git", "lfs", "track", "*.bin", "*.pt", "*.onnx"]
+
+
 def test_track_patterns_idempotency_skip(git_lfs: GitLFS, tmp_path: Path) -> None:
     """Test that patterns already in .gitattributes are skipped."""
     (tmp_path / ".gitattributes").write_text("*.bin filter=lfs diff=lfs merge=lfs -text\n", encoding="utf-8")
@@ -137,9 +176,9 @@ def test_track_patterns_idempotency_skip(git_lfs: GitLFS, tmp_path: Path) -> Non
         mock_run.assert_called_once_with(
             ["git", "lfs", "track", "*.pt"],
             cwd=tmp_path,
-            check=True,
-            capture_output=True,
-            text=True,
+            check=False,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
         )
 
 
@@ -160,9 +199,9 @@ def test_track_patterns_gitattributes_read_error(git_lfs: GitLFS, tmp_path: Path
                 mock_run.assert_called_once_with(
                     ["git", "lfs", "track", "*.bin"],
                     cwd=tmp_path,
-                    check=True,
-                    capture_output=True,
-                    text=True,
+                    check=False,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
                 )
 
 
@@ -180,8 +219,8 @@ def test_track_patterns_all_exist(git_lfs: GitLFS, tmp_path: Path) -> None:
 
 def test_track_patterns_failure(git_lfs: GitLFS, tmp_path: Path) -> None:
     patterns = ["*.bin"]
-    with patch("subprocess.run", side_effect=subprocess.CalledProcessError(1, "cmd", stderr="error")):
-        with pytest.raises(RuntimeError, match="Failed to track patterns"):
+    with patch("subprocess.run", return_value=MagicMock(returncode=1, stderr=b"error")):
+        with pytest.raises(RuntimeError, match="Failed to track patterns: error"):
             git_lfs.track_patterns(tmp_path, patterns)
 
 
@@ -200,12 +239,48 @@ def test_track_patterns_special_characters(git_lfs: GitLFS, tmp_path: Path) -> N
         mock_run.assert_called_once_with(
             expected_cmd,
             cwd=tmp_path,
-            check=True,
-            capture_output=True,
-            text=True,
+            check=False,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
         )
 
 
+def test_track_patterns_split_to_fit_arg_max(git_lfs: GitLFS, tmp_path: Path) -> None:
+    """Test that a pattern list too long for one command line is tracked over several commands."""
+    patterns = [f"*.ext{i}" for i in range(10)]
+    with (
+        patch("subprocess.run", return_value=MagicMock(returncode=0)) as mock_run,
+        # Each argument costs length + NUL + 8-byte argv pointer: "git lfs track" (38) plus four patterns (15 each)
+        patch("coreason_publisher.core.git_lfs._arg_budget", return_value=38 + 4 * 15),
+    ):
+        git_lfs.track_patterns(tmp_path, patterns)
+
+    commands = [call_args[0][0] for call_args in mock_run.call_args_list]
+    assert [cmd[:3] for cmd in commands] == [["git", "lfs", "track"]] * 3
+    assert [cmd[3:] for cmd in commands] == [patterns[:4], patterns[4:8], patterns[8:]]
+
+
+def test_arg_budget_posix_deducts_environment() -> None:
+    """Test that on POSIX the budget is ARG_MAX less the environment (key=value plus NUL and pointer)."""
+    with (
+        patch.object(os, "name", "posix"),
+        patch("os.sysconf", return_value=100_000),
+        patch.dict(os.environ, {"BIG": "x" * 5000}, clear=True),
+    ):
+        assert _arg_budget() == 100_000 - (3 + 5000 + 2) - 4096
+
+
+def test_arg_budget_windows_ignores_environment() -> None:
+    """Test that on Windows the fixed command-line budget applies, whatever the environment holds."""
+    with (
+        patch.object(os, "name", "nt"),
+        patch("os.sysconf", create=True) as mock_sysconf,
+        patch.dict(os.environ, {"BIG": "x" * 30_000}),
+    ):
+        assert _arg_budget() == 32000
+    mock_sysconf.assert_not_called()
+
+
 def test_initialize_git_executable_missing(git_lfs: GitLFS, tmp_path: Path) -> None:
     """Test that FileNotFoundError from subprocess (missing git) is caught and raised as RuntimeError."""
     with patch("subprocess.run", side_effect=FileNotFoundError):
@@ -272,6 +347,17 @@ def test_find_large_files_ignores_git_dir(git_lfs: GitLFS, tmp_path: Path) -> No
     assert str(Path(".git/objects/hash.bin")) not in found_paths
 
 
+@pytest.mark.parametrize("metadata_dir", [".hg", ".svn"])
+def test_find_large_files_ignores_other_vcs_dirs(git_lfs: GitLFS, tmp_path: Path, metadata_dir: str) -> None:
+    """Test that other version-control metadata directories are not descended into either."""
+    store = tmp_path / metadata_dir / "store"
+    store.mkdir(parents=True)
+    (store / "data.bin").write_bytes(b"\0" * 1024)
+    (tmp_path / "normal.bin").write_bytes(b"\0" * 1024)
+
+    assert git_lfs.find_large_files(tmp_path, 500) == ["normal.bin"]
+
+
 def test_find_large_files_none(git_lfs: GitLFS, tmp_path: Path) -> None:
     """Test finding no files when all are small."""
     (tmp_path / "small.txt").write_text("small")
@@ -291,6 +377,15 @@ def test_find_large_files_missing_path(git_lfs: GitLFS, tmp_path: Path) -> None:
     assert found_files == []
 
 
+def test_find_large_files_file_path(git_lfs: GitLFS, tmp_path: Path) -> None:
+    """Test that a file as the search path returns nothing without listing directories."""
+    file_path = tmp_path / "large.bin"
+    file_path.write_bytes(b"\0" * 200)
+    with patch("os.scandir") as mock_scandir:
+        assert git_lfs.find_large_files(file_path, 100) == []
+    mock_scandir.assert_not_called()
+
+
 def test_find_large_files_symlink(git_lfs: GitLFS, tmp_path: Path) -> None:
     """Test that symlinks are ignored."""
     target = tmp_path / "target.bin"
@@ -310,34 +405,98 @@ def test_find_large_files_symlink(git_lfs: GitLFS, tmp_path: Path) -> None:
     assert "link.bin" not in found_files
 
 
-def test_find_large_files_oserror_on_stat(git_lfs: GitLFS, tmp_path: Path) -> None:
-    """Test handling of OSError when checking file size."""
-    (tmp_path / "normal.txt").write_text("normal")
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="FIFOs not supported on this OS")
+def test_find_large_files_skips_non_regular_files(git_lfs: GitLFS, tmp_path: Path) -> None:
+    """Test that non-regular files such as FIFOs are never reported."""
+    os.mkfifo(tmp_path / "pipe")
+    (tmp_path / "large.bin").write_bytes(b"\0" * 200)
 
-    # We need to mock stat() to raise OSError for one file but work for others if needed
-    # Since rglob returns Path objects, we need to patch Path.stat or the iterator
+    assert git_lfs.find_large_files(tmp_path, 100) == ["large.bin"]
 
-    # Let's mock rglob to return a mock object that raises OSError on stat
-    mock_path = MagicMock(spec=Path)
-    mock_path.is_file.return_value = True
-    mock_path.is_symlink.return_value = False
-    mock_path.stat.side_effect = OSError("Permission denied")
-    # Mypy complains about assigning to return_value of __str__
-    cast(MagicMock, mock_path.__str__).return_value = str(tmp_path / "protected.bin")
 
-    with patch.object(Path, "rglob", return_value=[mock_path]):
+def test_find_large_files_oserror_on_stat(git_lfs: GitLFS, tmp_path: Path) -> None:
+    """Test handling of OSError when checking file size."""
+    # DirEntry can't be patched, so have scandir yield a stand-in entry whose stat() fails
+    entry = MagicMock(spec=os.DirEntry)
+    entry.name = "protected.bin"
+    entry.path = str(tmp_path / "protected.bin")
+    entry.is_symlink.return_value = False
+    entry.is_dir.return_value = False
+    entry.is_file.return_value = True
+    entry.stat.side_effect = OSError("Permission denied")
+
+    with patch("os.scandir") as mock_scandir:
+        mock_scandir.return_value.__enter__.return_value = [entry]
         # Should catch OSError and log warning, returning empty list (or list of successful ones)
         found_files = git_lfs.find_large_files(tmp_path, 100)
         assert found_files == []
 
 
+def test_find_large_files_unreadable_directory(git_lfs: GitLFS, tmp_path: Path) -> None:
+    """Test that a directory that can't be listed is skipped with a warning."""
+    with patch("os.scandir", side_effect=PermissionError("Permission denied")):
+        assert git_lfs.find_large_files(tmp_path, 100) == []
+
+
 def test_find_large_files_general_exception(git_lfs: GitLFS, tmp_path: Path) -> None:
     """Test handling of general exception during scan."""
-    with patch.object(Path, "rglob", side_effect=Exception("Disk error")):
+    with patch("os.scandir", side_effect=Exception("Disk error")):
         with pytest.raises(Exception, match="Disk error"):
             git_lfs.find_large_files(tmp_path, 100)
 
 
+def test_find_large_files_deep_tree(git_lfs: GitLFS, tmp_path: Path) -> None:
+    """Test that files in sibling and nested directories are all found, in a stable order."""
+    for rel in ["b/large.bin", "a/x/y/large.bin", "a/large.bin", "c/small.bin"]:
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"\0" * (1 if "small" in rel else 200))
+
+    assert git_lfs.find_large_files(tmp_path, 100) == ["a/large.bin", "a/x/y/large.bin", "b/large.bin"]
+
+
+def test_iter_large_files_is_lazy(git_lfs: GitLFS, tmp_path: Path) -> None:
+    """Test that nothing is listed until the first result is asked for, and closing ends the scan."""
+    (tmp_path / "large.bin").write_bytes(b"\0" * 200)
+    with patch("os.scandir", wraps=os.scandir) as mock_scandir:
+        large_files = git_lfs.iter_large_files(tmp_path, 100)
+        mock_scandir.assert_not_called()
+
+        assert next(large_files) == "large.bin"
+        large_files.close()
+        assert mock_scandir.call_count == 1
+        with pytest.raises(StopIteration):
+            next(large_files)
+
+
+def test_find_matching_large_files(git_lfs: GitLFS, tmp_path: Path) -> None:
+    """Test that only large files whose name matches a pattern are returned."""
+    for rel in ["model.bin", "sub/weights.pt", "sub/notes.txt", "small.bin"]:
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"\0" * (1 if "small" in rel else 200))
+
+    assert git_lfs.find_matching_large_files(tmp_path, 100, ["*.bin", "*.pt"]) == ["model.bin", "sub/weights.pt"]
+    assert git_lfs.find_matching_large_files(tmp_path, 100, []) == []
+
+
+def test_find_large_files_limit(git_lfs: GitLFS, tmp_path: Path) -> None:
+    """Test that the scan stops once `limit` large files have been found."""
+    large = {"a/large.bin", "b/large.bin", "c/large.bin"}
+    for rel in large:
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"\0" * 200)
+
+    found_files = git_lfs.find_large_files(tmp_path, 100, limit=2)
+    assert len(found_files) == 2
+    assert set(found_files) <= large
+    assert found_files == sorted(found_files)
+
+    assert git_lfs.find_large_files(tmp_path, 100, limit=0) == []
+    assert len(git_lfs.find_large_files(tmp_path, 100, limit=10)) == 3
+
+
 def test_find_large_files_boundary_conditions(git_lfs: GitLFS, tmp_path: Path) -> None:
     """
     Test boundary conditions for file size threshold.
@@ -401,7 +560,15 @@ def test_find_large_files_special_characters(git_lfs: GitLFS, tmp_path: Path) ->
 # --- verify_ready Tests ---
 
 
-def test_verify_ready_success(git_lfs: GitLFS, tmp_path: Path) -> None:
+@pytest.mark.parametrize(
+    "hook_content",
+    [
+        pytest.param(b"#!/bin/sh\ngit-lfs push --stdin\n", id="lfs-call"),
+        pytest.param(b'#!/bin/sh\n[ $# -gt 0 ] && git lfs pre-push "$@"\n', id="hash-in-parameter"),
+        pytest.param(b'#!/bin/sh\necho "#"; git lfs pre-push "$@"\n', id="hash-in-quotes"),
+    ],
+)
+def test_verify_ready_success(git_lfs: GitLFS, tmp_path: Path, hook_content: bytes) -> None:
     """
     Test that verify_ready passes when:
     1. Installed
@@ -413,7 +580,7 @@ def test_verify_ready_success(git_lfs: GitLFS, tmp_path: Path) -> None:
         patch.object(git_lfs, "is_installed", return_value=True),
         patch.object(git_lfs, "is_initialized", return_value=True),
         patch("coreason_publisher.core.git_lfs.subprocess.run") as mock_run,
-        patch("pathlib.Path.read_text", return_value="#!/bin/sh\ngit-lfs push --stdin\n"),
+        patch("pathlib.Path.open", mock_open(read_data=hook_content)),
         patch("pathlib.Path.exists", return_value=True),
         patch("os.access", return_value=True),  # executable check
     ):
@@ -457,14 +624,22 @@ def test_verify_ready_missing_hooks(git_lfs: GitLFS, tmp_path: Path) -> None:
             git_lfs.verify_ready(tmp_path)
 
 
-def test_verify_ready_broken_hooks(git_lfs: GitLFS, tmp_path: Path) -> None:
+@pytest.mark.parametrize(
+    "hook_content",
+    [
+        pytest.param(b"#!/bin/sh\necho 'hello'\n", id="no-lfs-call"),
+        pytest.param(b"#!/bin/sh\n# git lfs pre-push \"$@\"\necho 'hello'\n", id="lfs-call-commented-out"),
+        pytest.param(b"#!/bin/sh\necho 'hello' # git lfs pre-push\n", id="lfs-call-in-trailing-comment"),
+    ],
+)
+def test_verify_ready_broken_hooks(git_lfs: GitLFS, tmp_path: Path, hook_content: bytes) -> None:
     """Test verify_ready raises RuntimeError when hook content is invalid."""
     with (
         patch.object(git_lfs, "is_installed", return_value=True),
         patch.object(git_lfs, "is_initialized", return_value=True),
         patch("coreason_publisher.core.git_lfs.subprocess.run") as mock_run,
         patch("pathlib.Path.exists", return_value=True),  # hook exists
-        patch("pathlib.Path.read_text", return_value="#!/bin/sh\necho 'hello'\n"),  # Invalid content
+        patch("pathlib.Path.open", mock_open(read_data=hook_content)),  # Invalid content
     ):
         # Mock git rev-parse --git-path hooks
         mock_run.return_value = MagicMock(returncode=0, stdout=".git/hooks\n")
@@ -480,7 +655,7 @@ def test_verify_ready_hook_not_executable(git_lfs: GitLFS, tmp_path: Path) -> No
         patch.object(git_lfs, "is_initialized", return_value=True),
         patch("coreason_publisher.core.git_lfs.subprocess.run") as mock_run,
         patch("pathlib.Path.exists", return_value=True),  # hook exists
-        patch("pathlib.Path.read_text", return_value="#!/bin/sh\ngit-lfs push --stdin\n"),  # Valid content
+        patch("pathlib.Path.open", mock_open(read_data=b"#!/bin/sh\ngit-lfs push --stdin\n")),  # Valid content
         patch("os.access", return_value=False),  # NOT executable
     ):
         # Mock git rev-parse --git-path hooks
@@ -498,7 +673,7 @@ def test_verify_ready_git_dir_failure(git_lfs: GitLFS, tmp_path: Path) -> None:
         patch("coreason_publisher.core.git_lfs.subprocess.run") as mock_run,
     ):
         # Mock git rev-parse failing
-        mock_run.side_effect = subprocess.CalledProcessError(1, ["git", "rev-parse"])
+        mock_run.return_value = MagicMock(returncode=128, stderr="fatal: not a git repository")
 
         with pytest.raises(RuntimeError, match="Failed to determine git directory"):
             git_lfs.verify_ready(tmp_path)
@@ -532,7 +707,7 @@ def test_verify_ready_subdirectory(git_lfs: GitLFS, tmp_path: Path) -> None:
         patch.object(git_lfs, "is_initialized", return_value=True),
         patch("coreason_publisher.core.git_lfs.subprocess.run") as mock_run,
         patch("pathlib.Path.exists", return_value=True),
-        patch("pathlib.Path.read_text", return_value="git-lfs"),
+        patch("pathlib.Path.open", mock_open(read_data=b"git-lfs")),
         patch("os.access", return_value=True),  # executable
     ):
         # Mock git rev-parse --git-path hooks
@@ -551,19 +726,16 @@ def test_is_initialized_in_subdirectory(git_lfs: GitLFS, tmp_path: Path) -> None
 
     # We mock subprocess.run to simulate git responses
     with patch("coreason_publisher.core.git_lfs.subprocess.run") as mock_run:
-        # Sequence of calls:
-        # 1. git rev-parse --is-inside-work-tree -> 0
-        # 2. git lfs env -> 0
-
-        mock_run.side_effect = [
-            MagicMock(returncode=0),  # rev-parse
-            MagicMock(returncode=0, stdout="Endpoint=https://test\n"),  # lfs env
-        ]
+        # git rev-parse --is-inside-work-tree -> 0, git lfs env -> 0
+        mock_run.side_effect = git_probes(
+            [MagicMock(returncode=0)],
+            [MagicMock(returncode=0, stdout="Endpoint=https://test\n")],
+        )
 
         assert git_lfs.is_initialized(subdir) is True
         assert mock_run.call_count == 2
-        # Verify first call args check for rev-parse
-        assert mock_run.call_args_list[0][0][0] == ["git", "rev-parse", "--is-inside-work-tree"]
+        # Verify the work-tree check is done with rev-parse
+        assert any(call_args[0][0] == REV_PARSE_CMD for call_args in mock_run.call_args_list)
 
 
 def test_verify_ready_absolute_git_dir(git_lfs: GitLFS, tmp_path: Path) -> None:
@@ -574,7 +746,7 @@ def test_verify_ready_absolute_git_dir(git_lfs: GitLFS, tmp_path: Path) -> None:
         patch.object(git_lfs, "is_installed", return_value=True),
         patch.object(git_lfs, "is_initialized", return_value=True),
         patch("coreason_publisher.core.git_lfs.subprocess.run") as mock_run,
-        patch("pathlib.Path.read_text", return_value="#!/bin/sh\ngit-lfs push --stdin\n"),
+        patch("pathlib.Path.open", mock_open(read_data=b"#!/bin/sh\ngit-lfs push --stdin\n")),
         patch("pathlib.Path.exists", return_value=True),
         patch("os.access", return_value=True),
     ):
@@ -605,7 +777,7 @@ def test_verify_ready_worktree_structure(git_lfs: GitLFS, tmp_path: Path) -> Non
         patch.object(git_lfs, "is_installed", return_value=True),
         patch.object(git_lfs, "is_initialized", return_value=True),
         patch("coreason_publisher.core.git_lfs.subprocess.run") as mock_run,
-        # We don't patch Path.exists/read_text here, we rely on the real file system
+        # We don't patch Path.exists/open here, we rely on the real file system
         # created above. But we need to patch os.access for executable check.
         patch("os.access", return_value=True),
     ):
@@ -616,9 +788,75 @@ def test_verify_ready_worktree_structure(git_lfs: GitLFS, tmp_path: Path) -> Non
 
         # Verify calls
         mock_run.assert_called_with(
-            ["git", "rev-parse", "--git-path", "hooks"],
+            REV_PARSE_CMD,
             cwd=worktree_path,
             capture_output=True,
             text=True,
-            check=True,
+            check=False,
         )
+
+
+def test_is_initialized_then_verify_ready_share_probes(git_lfs: GitLFS, tmp_path: Path) -> None:
+    """Test that verify_ready reuses the rev-parse and lfs env results from is_initialized."""
+    with (
+        patch.object(git_lfs, "is_installed", return_value=True),
+        patch("coreason_publisher.core.git_lfs.subprocess.run") as mock_run,
+        patch("pathlib.Path.open", mock_open(read_data=b"#!/bin/sh\ngit-lfs push --stdin\n")),
+        patch("pathlib.Path.exists", return_value=True),
+        patch("os.access", return_value=True),
+    ):
+        mock_run.side_effect = git_probes(
+            [MagicMock(returncode=0, stdout="true\n.git/hooks\n")],
+            [MagicMock(returncode=0, stdout="Endpoint=https://test\n")],
+        )
+
+        assert git_lfs.is_initialized(tmp_path) is True
+        git_lfs.verify_ready(tmp_path)
+
+        assert mock_run.call_count == 2
+
+
+def test_failed_probe_is_not_cached(git_lfs: GitLFS, tmp_path: Path) -> None:
+    """Test that a failing rev-parse is retried on the next check."""
+    with patch("coreason_publisher.core.git_lfs.subprocess.run") as mock_run:
+        mock_run.side_effect = git_probes(
+            [MagicMock(returncode=128), MagicMock(returncode=0)],  # not a repo yet, then a repo
+            [MagicMock(returncode=0, stdout="Endpoint=https://test\n")],
+        )
+
+        assert git_lfs.is_initialized(tmp_path) is False
+        assert git_lfs.is_initialized(tmp_path) is True
+        # rev-parse twice; the successful lfs env from the first check is reused
+        assert mock_run.call_count == 3
+
+
+def test_initialize_clears_probe_cache(git_lfs: GitLFS, tmp_path: Path) -> None:
+    """Test that initialize() forces the next is_initialized to probe again."""
+    with patch("coreason_publisher.core.git_lfs.subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(returncode=0, stdout="Endpoint=https://test\n")
+
+        assert git_lfs.is_initialized(tmp_path) is True
+        git_lfs.initialize(tmp_path)
+        assert git_lfs.is_initialized(tmp_path) is True
+
+        # rev-parse + lfs env, install, then rev-parse + lfs env again
+        assert mock_run.call_count == 5
+
+
+def test_probe_cache_expires(git_lfs: GitLFS, tmp_path: Path) -> None:
+    """Test that cached probes are re-run once they are older than the TTL."""
+    with (
+        patch("coreason_publisher.core.git_lfs.subprocess.run") as mock_run,
+        patch("coreason_publisher.core.git_lfs.time.monotonic") as mock_clock,
+    ):
+        mock_run.return_value = MagicMock(returncode=0, stdout="Endpoint=https://test\n")
+
+        mock_clock.return_value = 100.0
+        assert git_lfs.is_initialized(tmp_path) is True
+        mock_clock.return_value = 100.0 + _PROBE_TTL - 0.1
+        assert git_lfs.is_initialized(tmp_path) is True
+        assert mock_run.call_count == 2
+
+        mock_clock.return_value = 100.0 + _PROBE_TTL
+        assert git_lfs.is_initialized(tmp_path) is True
+        assert mock_run.call_count == 4
@@ -9,7 +9,12 @@
 # Source Code: https://github.com/CoReason-AI/coreason_publisher
 
 import os
-from typing import Generator
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Generator, List, Tuple
 from unittest.mock import MagicMock, patch
 
 import gitlab
@@ -47,6 +52,62 @@ def test_init_with_none_config(mock_gitlab: MagicMock) -> None:
         assert provider.token == "env_token"
 
 
+def test_init_shares_pooled_session(provider: GitLabProvider, mock_gitlab: MagicMock) -> None:
+    """Test that the client gets one keep-alive session with a widened pool and read-only retries."""
+    kwargs = mock_gitlab.call_args.kwargs
+    # python-gitlab's own retry would also repeat POSTs, so it must stay off
+    assert "retry_transient_errors" not in kwargs
+    adapter = kwargs["session"].get_adapter("https://gitlab.com/api/v4/projects")
+    assert adapter.max_retries.allowed_methods == frozenset({"GET", "HEAD"})
+
+
+@pytest.fixture
+def bad_gateway_server() -> Generator[Tuple[str, List[str]], None, None]:
+    """A local HTTP server answering every request with 502; yields its URL and the methods it saw."""
+    seen: List[str] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self) -> None:
+            seen.append(self.command)
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            self.send_response(502)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        do_GET = do_POST = _reply
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}", seen
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_provider_retries_only_idempotent_requests(bad_gateway_server: Tuple[str, List[str]]) -> None:
+    """Test that a 502 on a POST fails after one attempt, while a GET is retried before failing."""
+    url, seen = bad_gateway_server
+    config = PublisherConfig(gitlab_token=SecretStr("token"), gitlab_url=url)
+    provider = GitLabProvider(project_id="1", config=config)
+    provider.gl.session.trust_env = False  # Don't route the loopback requests through a configured proxy
+
+    with patch("urllib3.util.retry.time.sleep"):
+        with pytest.raises(RuntimeError, match="Failed to get project 1"):
+            _ = provider.project
+    assert seen == ["GET"] * 4
+
+    seen.clear()
+    provider._project = provider.gl.projects.get(1, lazy=True)
+    with pytest.raises(RuntimeError, match="Failed to create tag v1.0.0"):
+        provider.create_tag("v1.0.0", "main", "Release")
+    assert seen == ["POST"]
+
+
 def test_project_property(provider: GitLabProvider, mock_gitlab: MagicMock) -> None:
     mock_project = MagicMock()
     mock_gitlab.return_value.projects.get.return_value = mock_project
@@ -59,6 +120,26 @@ def test_project_property(provider: GitLabProvider, mock_gitlab: MagicMock) -> N
     assert mock_gitlab.return_value.projects.get.call_count == 1
 
 
+def test_project_property_concurrent_first_access(provider: GitLabProvider, mock_gitlab: MagicMock) -> None:
+    """Test that threads racing on the first .project access trigger a single projects.get."""
+    mock_project = MagicMock()
+    release = threading.Event()
+
+    def slow_get(project_id: str) -> MagicMock:
+        release.wait(timeout=5)
+        return mock_project
+
+    mock_gitlab.return_value.projects.get.side_effect = slow_get
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        futures = [pool.submit(lambda: provider.project) for _ in range(16)]
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert all(result is mock_project for result in results)
+    mock_gitlab.return_value.projects.get.assert_called_once_with("test/project")
+
+
 def test_project_property_error(provider: GitLabProvider, mock_gitlab: MagicMock) -> None:
     mock_gitlab.return_value.projects.get.side_effect = gitlab.GitlabGetError(response_code=404)
     with pytest.raises(RuntimeError, match="Failed to get project"):
@@ -140,6 +221,39 @@ def test_create_tag_error(provider: GitLabProvider) -> None:
         provider.create_tag("v1.0.0", "sha123", "Release v1.0.0")
 
 
+def test_create_tags_success(provider: GitLabProvider) -> None:
+    mock_project = MagicMock()
+    provider._project = mock_project
+    tags = [(f"v1.0.{i}", f"sha{i}", f"Release v1.0.{i}") for i in range(5)]
+
+    provider.create_tags(tags)
+
+    assert mock_project.tags.create.call_count == 5
+    for name, ref, message in tags:
+        mock_project.tags.create.assert_any_call({"tag_name": name, "ref": ref, "message": message})
+
+
+def test_create_tags_reports_every_failure(provider: GitLabProvider) -> None:
+    mock_project = MagicMock()
+    provider._project = mock_project
+
+    def create(data: Dict[str, str]) -> None:
+        if data["tag_name"] != "v1.0.1":
+            raise gitlab.GitlabCreateError(f"{data['tag_name']} exists", response_code=400)
+
+    mock_project.tags.create.side_effect = create
+
+    with pytest.raises(RuntimeError, match="Failed to create tags: v1.0.0: .*; v1.0.2: "):
+        provider.create_tags([("v1.0.0", "a", "m"), ("v1.0.1", "b", "m"), ("v1.0.2", "c", "m")])
+    # The tag that could be created still was
+    assert mock_project.tags.create.call_count == 3
+
+
+def test_create_tags_empty(provider: GitLabProvider, mock_gitlab: MagicMock) -> None:
+    provider.create_tags([])
+    mock_gitlab.return_value.projects.get.assert_not_called()
+
+
 def test_get_last_tag_success(provider: GitLabProvider) -> None:
     mock_project = MagicMock()
     provider._project = mock_project
@@ -320,3 +434,52 @@ def test_complex_lifecycle_scenario(provider: GitLabProvider) -> None:
     # 4. Merge
     provider.merge_merge_request(mr_id)
     mock_mr.merge.assert_called_once()
+
+
+def test_gitlab_imported_lazily() -> None:
+    """Test that importing the provider module (as the CLI does) doesn't import python-gitlab."""
+    code = "import sys, coreason_publisher.core.gitlab_provider; sys.exit('gitlab' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+def test_init_keeps_patched_gitlab_module() -> None:
+    """Test that constructing a provider doesn't rebind a ``gitlab`` name a test has patched."""
+    fake_gitlab = MagicMock()
+    with patch("coreason_publisher.core.gitlab_provider.gitlab", fake_gitlab):
+        provider = GitLabProvider(project_id="test/project", config=PublisherConfig(gitlab_token=SecretStr("token")))
+        assert provider.gl is fake_gitlab.Gitlab.return_value
+
+
+def test_post_comments_success(provider: GitLabProvider) -> None:
+    mock_project = MagicMock()
+    provider._project = mock_project
+    mock_mr = MagicMock()
+    mock_project.mergerequests.get.return_value = mock_mr
+
+    provider.post_comments(123, ["First", "Second", "Third"])
+
+    mock_project.mergerequests.get.assert_called_once_with(123)
+    assert sorted(c.args[0]["body"] for c in mock_mr.notes.create.call_args_list) == ["First", "Second", "Third"]
+
+
+def test_post_comments_mr_error(provider: GitLabProvider) -> None:
+    mock_project = MagicMock()
+    provider._project = mock_project
+    mock_project.mergerequests.get.side_effect = gitlab.GitlabGetError(response_code=404)
+
+    with pytest.raises(RuntimeError, match="Failed to post comments to MR 123"):
+        provider.post_comments(123, ["First"])
+
+
+def test_post_comments_reports_failed_comment(provider: GitLabProvider) -> None:
+    mock_project = MagicMock()
+    provider._project = mock_project
+    mock_mr = MagicMock()
+    mock_project.mergerequests.get.return_value = mock_mr
+    mock_mr.notes.create.side_effect = [None, gitlab.GitlabCreateError(response_code=400)]
+    provider.concurrency = 1  # post in order, so the second call is the second comment
+
+    with pytest.raises(RuntimeError, match="Failed to post comments to MR 123: comment 2: "):
+        # Same body twice: the failure is still reported by position
+        provider.post_comments(123, ["Same", "Same"])
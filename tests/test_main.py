@@ -8,9 +8,8 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_publisher
 
-import os
 from pathlib import Path
-from typing import Generator
+from typing import Any, Callable, Dict, Generator, List
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -21,23 +20,79 @@ from typer.testing import CliRunner
 from coreason_publisher.core.gitlab_provider import GitLabProvider
 from coreason_publisher.core.orchestrator import PublisherOrchestrator
 from coreason_publisher.core.version_manager import BumpType
-from coreason_publisher.main import app, get_orchestrator, main
-
-runner = CliRunner()
+from coreason_publisher.main import app, get_orchestrator, main, propose, reject, release
+
+# Each CLI command, arguments for a direct call, and the orchestrator method it drives
+COMMANDS = [
+    pytest.param(
+        propose,
+        {"project_id": "proj-1", "draft_id": "draft-1", "bump": BumpType.PATCH},
+        "propose_release",
+        id="propose",
+    ),
+    pytest.param(release, {"mr_id": 123, "signature": "bad-sig"}, "finalize_release", id="release"),
+    pytest.param(reject, {"mr_id": 123, "draft_id": "draft-1", "reason": "fail"}, "reject_release", id="reject"),
+]
+
+ORCHESTRATOR_ENV = {
+    "GITLAB_TOKEN": "token",
+    "ASSAY_API_URL": "http://assay.com",
+    "ASSAY_API_TOKEN": "assay-token",
+    "FOUNDRY_API_URL": "http://foundry.com",
+    "FOUNDRY_API_TOKEN": "foundry-token",
+}
 
 
 @pytest.fixture
-def mock_orchestrator() -> Generator[MagicMock, None, None]:
-    with patch("coreason_publisher.main.get_orchestrator") as mock_get:
-        mock_orch_instance = MagicMock(spec=PublisherOrchestrator)
-        mock_get.return_value = mock_orch_instance
+def mock_orchestrator(spec_mock: Callable[[type], MagicMock]) -> Generator[MagicMock, None, None]:
+    mock_orch_instance = spec_mock(PublisherOrchestrator)
+    with patch("coreason_publisher.main.get_orchestrator", return_value=mock_orch_instance):
         yield mock_orch_instance
 
 
-def test_propose_command(mock_orchestrator: MagicMock, mock_user_context: UserContext) -> None:
-    """Test the propose command calls the orchestrator correctly."""
+@pytest.fixture
+def orchestrator_env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> pytest.MonkeyPatch:
+    """
+    Prepares get_orchestrator to run against ORCHESTRATOR_ENV, with no GITLAB_PROJECT_ID.
+
+    Points Path.cwd at tmp_path and stubs out the local git tooling. Tests adjust the
+    environment further through the returned monkeypatch.
+    """
+    for key, value in ORCHESTRATOR_ENV.items():
+        monkeypatch.setenv(key, value)
+    monkeypatch.delenv("GITLAB_PROJECT_ID", raising=False)
+    monkeypatch.setattr(Path, "cwd", lambda: tmp_path)
+    monkeypatch.setattr("coreason_publisher.main.GitLocal", MagicMock())
+    monkeypatch.setattr("coreason_publisher.main.GitLFS", MagicMock())
+    return monkeypatch
+
+
+@pytest.fixture
+def build_orchestrator(
+    orchestrator_env: pytest.MonkeyPatch,
+) -> Generator[Callable[[], PublisherOrchestrator], None, None]:
+    """Calls get_orchestrator under orchestrator_env, closing every orchestrator it built at teardown."""
+    built: List[PublisherOrchestrator] = []
+
+    def build() -> PublisherOrchestrator:
+        orch = get_orchestrator()
+        built.append(orch)
+        return orch
+
+    yield build
+    for orch in built:
+        orch.close()
+
+
+def test_propose_command(mock_orchestrator: MagicMock, mock_user_context: UserContext, cli_runner: CliRunner) -> None:
+    """
+    Test the propose command calls the orchestrator correctly.
+
+    This is the one test that goes through the Typer app, covering option parsing and the
+    enum conversion; the others call the command functions directly.
+    """
     with patch("coreason_publisher.main.get_cli_context", return_value=mock_user_context):
-        result = runner.invoke(
+        result = cli_runner.invoke(
             app,
             [
                 "propose",
@@ -55,131 +110,96 @@ def test_propose_command(mock_orchestrator: MagicMock, mock_user_context: UserCo
     assert result.exit_code == 0
     assert "Release proposal submitted successfully" in result.stdout
 
-    mock_orchestrator.propose_release.assert_called_once()
-    call_kwargs = mock_orchestrator.propose_release.call_args.kwargs
-    assert call_kwargs["project_id"] == "proj-1"
-    assert call_kwargs["foundry_draft_id"] == "draft-1"
-    # When passed from Typer, it comes as the Enum member
-    assert call_kwargs["bump_type"] == BumpType.MINOR
-    assert call_kwargs["user_context"] == mock_user_context
-    assert call_kwargs["release_description"] == "test release"
-
-
-def test_propose_command_failure(mock_orchestrator: MagicMock, mock_user_context: UserContext) -> None:
-    """Test the propose command handles exceptions."""
-    mock_orchestrator.propose_release.side_effect = RuntimeError("Something went wrong")
-
-    with patch("coreason_publisher.main.get_cli_context", return_value=mock_user_context):
-        result = runner.invoke(app, ["propose", "--project-id", "proj-1", "--draft-id", "draft-1", "--bump", "patch"])
-
-    assert result.exit_code == 1
-    assert "Error: Something went wrong" in result.stdout
+    # When passed from Typer, the bump type comes as the Enum member
+    mock_orchestrator.propose_release.assert_called_once_with(
+        project_id="proj-1",
+        foundry_draft_id="draft-1",
+        bump_type=BumpType.MINOR,
+        user_context=mock_user_context,
+        release_description="test release",
+    )
+    mock_orchestrator.close.assert_called_once_with()
 
 
-def test_release_command(mock_orchestrator: MagicMock, mock_user_context: UserContext) -> None:
+def test_release_command(
+    mock_orchestrator: MagicMock, mock_user_context: UserContext, capsys: pytest.CaptureFixture[str]
+) -> None:
     """Test the release command calls the orchestrator correctly."""
     with patch("coreason_publisher.main.get_cli_context", return_value=mock_user_context):
-        result = runner.invoke(app, ["release", "--mr-id", "123", "--signature", "valid-sig"])
+        release(mr_id=123, signature="valid-sig")
 
-    assert result.exit_code == 0
-    assert "Release finalized successfully" in result.stdout
+    assert "Release finalized successfully" in capsys.readouterr().out
 
     mock_orchestrator.finalize_release.assert_called_once_with(
         mr_id=123, srb_signature="valid-sig", user_context=mock_user_context
     )
+    mock_orchestrator.close.assert_called_once_with()
 
 
-def test_release_command_failure(mock_orchestrator: MagicMock, mock_user_context: UserContext) -> None:
-    """Test the release command handles exceptions."""
-    mock_orchestrator.finalize_release.side_effect = ValueError("Invalid signature")
-
-    with patch("coreason_publisher.main.get_cli_context", return_value=mock_user_context):
-        result = runner.invoke(app, ["release", "--mr-id", "123", "--signature", "bad-sig"])
-
-    assert result.exit_code == 1
-    assert "Error: Invalid signature" in result.stdout
-
-
-def test_reject_command(mock_orchestrator: MagicMock) -> None:
+def test_reject_command(mock_orchestrator: MagicMock, capsys: pytest.CaptureFixture[str]) -> None:
     """Test the reject command calls the orchestrator correctly."""
-    result = runner.invoke(
-        app,
-        ["reject", "--mr-id", "123", "--draft-id", "draft-1", "--reason", "bad code"],
-    )
+    reject(mr_id=123, draft_id="draft-1", reason="bad code")
 
-    assert result.exit_code == 0
-    assert "Release rejected successfully" in result.stdout
+    assert "Release rejected successfully" in capsys.readouterr().out
 
     mock_orchestrator.reject_release.assert_called_once_with(mr_id=123, draft_id="draft-1", reason="bad code")
+    mock_orchestrator.close.assert_called_once_with()
 
 
-def test_reject_command_failure(mock_orchestrator: MagicMock) -> None:
-    """Test the reject command handles exceptions."""
-    mock_orchestrator.reject_release.side_effect = RuntimeError("Failed to reject")
+@pytest.mark.parametrize(("command", "kwargs", "method"), COMMANDS)
+def test_command_failure(
+    mock_orchestrator: MagicMock,
+    mock_user_context: UserContext,
+    capsys: pytest.CaptureFixture[str],
+    command: Callable[..., None],
+    kwargs: Dict[str, Any],
+    method: str,
+) -> None:
+    """Test each command reports an orchestrator failure and exits with status 1."""
+    getattr(mock_orchestrator, method).side_effect = RuntimeError("Something went wrong")
 
-    result = runner.invoke(
-        app,
-        ["reject", "--mr-id", "123", "--draft-id", "draft-1", "--reason", "fail"],
-    )
+    with patch("coreason_publisher.main.get_cli_context", return_value=mock_user_context):
+        with pytest.raises(Exit) as e:
+            command(**kwargs)
 
-    assert result.exit_code == 1
-    assert "Error: Failed to reject" in result.stdout
+    assert e.value.exit_code == 1
+    assert "Error: Something went wrong" in capsys.readouterr().out
+    mock_orchestrator.close.assert_called_once_with()
 
 
-def test_get_orchestrator_success(tmp_path: Path) -> None:
+def test_get_orchestrator_success(
+    orchestrator_env: pytest.MonkeyPatch, build_orchestrator: Callable[[], PublisherOrchestrator]
+) -> None:
     """Test successful initialization of orchestrator."""
-    env_vars = {
-        "GITLAB_TOKEN": "token",
-        "ASSAY_API_URL": "http://assay.com",
-        "ASSAY_API_TOKEN": "assay-token",
-        "FOUNDRY_API_URL": "http://foundry.com",
-        "FOUNDRY_API_TOKEN": "foundry-token",
-        "GITLAB_PROJECT_ID": "100",
-    }
-
-    with patch.dict(os.environ, env_vars):
-        with patch("pathlib.Path.cwd", return_value=tmp_path):
-            with patch("coreason_publisher.main.GitLocal"):
-                with patch("coreason_publisher.main.GitLFS"):
-                    orch = get_orchestrator()
-                    assert isinstance(orch, PublisherOrchestrator)
-                    assert isinstance(orch.git_provider, GitLabProvider)
-                    assert orch.git_provider.project_id == "100"
-
-
-def test_get_orchestrator_fallback_project_id(tmp_path: Path) -> None:
+    orchestrator_env.setenv("GITLAB_PROJECT_ID", "100")
+
+    orch = build_orchestrator()
+    assert isinstance(orch, PublisherOrchestrator)
+    assert isinstance(orch.git_provider, GitLabProvider)
+    assert orch.git_provider.project_id == "100"
+
+
+def test_get_orchestrator_fallback_project_id(build_orchestrator: Callable[[], PublisherOrchestrator]) -> None:
     """Test initialization when GITLAB_PROJECT_ID is missing (fallback)."""
-    env_vars = {
-        "GITLAB_TOKEN": "token",
-        "ASSAY_API_URL": "http://assay.com",
-        "ASSAY_API_TOKEN": "assay-token",
-        "FOUNDRY_API_URL": "http://foundry.com",
-        "FOUNDRY_API_TOKEN": "foundry-token",
-        # GITLAB_PROJECT_ID missing
-    }
-
-    with patch.dict(os.environ, env_vars, clear=True):
-        with patch("pathlib.Path.cwd", return_value=tmp_path):
-            with patch("coreason_publisher.main.GitLocal"):
-                with patch("coreason_publisher.main.GitLFS"):
-                    orch = get_orchestrator()
-                    # Should fallback to "0"
-                    assert isinstance(orch.git_provider, GitLabProvider)
-                    assert orch.git_provider.project_id == "0"
-
-
-def test_get_orchestrator_failure() -> None:
+    orch = build_orchestrator()
+    # Should fallback to "0"
+    assert isinstance(orch.git_provider, GitLabProvider)
+    assert orch.git_provider.project_id == "0"
+
+
+def test_get_orchestrator_failure(orchestrator_env: pytest.MonkeyPatch) -> None:
     """Test initialization failure (missing env var)."""
     # Missing variables should cause ValueError in client inits
-    with patch.dict(os.environ, {}, clear=True):
-        with patch("pathlib.Path.cwd", return_value=Path("/tmp")):
-            with pytest.raises(Exit) as e:
-                get_orchestrator()
-            assert e.value.exit_code == 1
+    for key in ORCHESTRATOR_ENV:
+        orchestrator_env.delenv(key)
+
+    with pytest.raises(Exit) as e:
+        get_orchestrator()
+    assert e.value.exit_code == 1
 
 
-def test_main_entry_point() -> None:
+@patch("coreason_publisher.main.app")
+def test_main_entry_point(mock_app: MagicMock) -> None:
     """Test the main entry point function."""
-    with patch("coreason_publisher.main.app") as mock_app:
-        main()
-        mock_app.assert_called_once()
+    main()
+    mock_app.assert_called_once()
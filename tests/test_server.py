@@ -8,76 +8,130 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_publisher
 
-from collections.abc import Generator
-from typing import Any
+import json
+from collections.abc import AsyncGenerator, Generator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, List, Optional
 from unittest.mock import MagicMock, patch
 
 import pytest
-from coreason_identity.models import UserContext
-from fastapi.testclient import TestClient
+import pytest_asyncio
 
-from coreason_publisher.server import app, get_user_context
+# The FastAPI app and its HTTP client are imported inside the fixtures below, so collecting
+# this module (e.g. for a -k run that selects none of its tests) doesn't import the server.
+if TYPE_CHECKING:
+    import httpx
+    from coreason_identity.models import UserContext
 
+# Every test shares the module's event loop, so the client fixture below can live that long
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-@pytest.fixture
+# Request bodies are serialized once and posted as raw bytes
+JSON_HEADERS = {"content-type": "application/json"}
+PROPOSE_BODY = json.dumps(
+    {
+        "project_id": "proj-1",
+        "draft_id": "draft-1",
+        "bump_type": "patch",
+        "description": "desc",
+    }
+).encode()
+RELEASE_BODY = json.dumps({"mr_id": 123, "srb_signature": "sig"}).encode()
+REJECT_BODY = json.dumps({"mr_id": 123, "draft_id": "draft-1", "reason": "bad code"}).encode()
+
+# How each endpoint maps orchestrator exceptions onto HTTP statuses
+ERROR_STATUSES = [
+    pytest.param(ValueError, 400, id="value_error"),
+    pytest.param(RuntimeError, 502, id="runtime_error"),
+    pytest.param(Exception, 500, id="exception"),
+]
+
+
+def outcomes(success_status: int) -> List[Any]:
+    """An endpoint's (exception, status) cases: the success case first, then ERROR_STATUSES."""
+    return [pytest.param(None, success_status, id="success"), *ERROR_STATUSES]
+
+
+@pytest.fixture(scope="module")
 def mock_orchestrator() -> MagicMock:
-    orchestrator = MagicMock()
-    # Setup LFS check for health endpoint
-    orchestrator.git_lfs.is_initialized.return_value = True
-    return orchestrator
+    # Shared by every test in the module; reset_orchestrator restores it between tests
+    return MagicMock()
 
 
-@pytest.fixture
-def client(mock_orchestrator: MagicMock, mock_user_context: UserContext) -> Generator[TestClient, Any, None]:
-    # Patch get_orchestrator used in lifespan to return our mock
-    # Use dependency_overrides for FastAPI dependencies
-    app.dependency_overrides[get_user_context] = lambda: mock_user_context
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def client() -> AsyncGenerator["httpx.AsyncClient", None]:
+    # One client for the whole module. Requests go straight to the ASGI app, without
+    # TestClient's thread portal. The app's lifespan isn't run: reset_orchestrator hands
+    # the mock to the endpoints through get_orch, so there is nothing for startup to build
+    import httpx
 
-    with patch("coreason_publisher.server.get_orchestrator", return_value=mock_orchestrator):
-        with TestClient(app) as client:
-            yield client
+    from coreason_publisher.server import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def reset_orchestrator(mock_orchestrator: MagicMock, mock_user_context: "UserContext") -> Generator[None, Any, None]:
+    """Gives each test a clean orchestrator mock and the test user, as a fresh client would."""
+    from coreason_publisher.server import app, get_orch, get_user_context
 
+    mock_orchestrator.reset_mock(return_value=True, side_effect=True)
+    # Setup LFS check for health endpoint
+    mock_orchestrator.git_lfs.is_initialized.return_value = True
+    # Use dependency_overrides for FastAPI dependencies
+    app.dependency_overrides[get_orch] = lambda: mock_orchestrator
+    app.dependency_overrides[get_user_context] = lambda: mock_user_context
+    yield
     # Cleanup overrides
     app.dependency_overrides = {}
 
 
-def test_health_check_success(client: TestClient, mock_orchestrator: MagicMock) -> None:
+async def test_health_check_success(client: "httpx.AsyncClient", mock_orchestrator: MagicMock) -> None:
     mock_orchestrator.git_provider.get_last_tag.return_value = "v1.0.0"
-    response = client.get("/health")
+    response = await client.get("/health")
     assert response.status_code == 200
     assert response.json() == {"status": "healthy"}
     mock_orchestrator.git_lfs.is_initialized.assert_called_once()
     mock_orchestrator.git_provider.get_last_tag.assert_called_once()
 
 
-def test_health_check_lfs_failure(client: TestClient, mock_orchestrator: MagicMock) -> None:
-    mock_orchestrator.git_lfs.is_initialized.return_value = False
-    response = client.get("/health")
-    assert response.status_code == 503
-    assert "Git LFS" in response.json()["detail"]
-
-
-def test_health_check_provider_failure(client: TestClient, mock_orchestrator: MagicMock) -> None:
-    mock_orchestrator.git_provider.get_last_tag.side_effect = RuntimeError("Auth failed")
-    response = client.get("/health")
+@pytest.mark.parametrize(
+    ("lfs_ready", "provider_error", "detail"),
+    [
+        pytest.param(False, None, "Git LFS", id="lfs_failure"),
+        pytest.param(True, RuntimeError("Auth failed"), "Git Provider check failed", id="provider_failure"),
+    ],
+)
+async def test_health_check_failure(
+    client: "httpx.AsyncClient",
+    mock_orchestrator: MagicMock,
+    lfs_ready: bool,
+    provider_error: Optional[Exception],
+    detail: str,
+) -> None:
+    mock_orchestrator.git_lfs.is_initialized.return_value = lfs_ready
+    mock_orchestrator.git_provider.get_last_tag.side_effect = provider_error
+    response = await client.get("/health")
     assert response.status_code == 503
-    assert "Git Provider check failed" in response.json()["detail"]
+    assert detail in response.json()["detail"]
 
 
 # --- Propose Release Tests ---
 
 
-def test_propose_release_success(
-    client: TestClient, mock_orchestrator: MagicMock, mock_user_context: UserContext
+@pytest.mark.parametrize(("exc", "status_code"), outcomes(202))
+async def test_propose_release(
+    client: "httpx.AsyncClient",
+    mock_orchestrator: MagicMock,
+    mock_user_context: "UserContext",
+    exc: Optional[type[Exception]],
+    status_code: int,
 ) -> None:
-    payload = {
-        "project_id": "proj-1",
-        "draft_id": "draft-1",
-        "bump_type": "patch",
-        "description": "desc",
-    }
-    response = client.post("/propose", json=payload)
-    assert response.status_code == 202
+    mock_orchestrator.propose_release.side_effect = None if exc is None else exc("Orchestrator failed")
+    response = await client.post("/propose", content=PROPOSE_BODY, headers=JSON_HEADERS)
+    assert response.status_code == status_code
     mock_orchestrator.propose_release.assert_called_once_with(
         project_id="proj-1",
         foundry_draft_id="draft-1",
@@ -85,126 +139,92 @@ def test_propose_release_success(
         user_context=mock_user_context,
         release_description="desc",
     )
-
-
-def test_propose_release_value_error(client: TestClient, mock_orchestrator: MagicMock) -> None:
-    mock_orchestrator.propose_release.side_effect = ValueError("Invalid input")
-    payload = {
-        "project_id": "proj-1",
-        "draft_id": "draft-1",
-        "bump_type": "patch",
-        "description": "desc",
-    }
-    response = client.post("/propose", json=payload)
-    assert response.status_code == 400
-    assert "Invalid input" in response.json()["detail"]
-
-
-def test_propose_release_runtime_error(client: TestClient, mock_orchestrator: MagicMock) -> None:
-    mock_orchestrator.propose_release.side_effect = RuntimeError("GitLab error")
-    payload = {
-        "project_id": "proj-1",
-        "draft_id": "draft-1",
-        "bump_type": "patch",
-        "description": "desc",
-    }
-    response = client.post("/propose", json=payload)
-    assert response.status_code == 502
-    assert "GitLab error" in response.json()["detail"]
-
-
-def test_propose_release_exception(client: TestClient, mock_orchestrator: MagicMock) -> None:
-    mock_orchestrator.propose_release.side_effect = Exception("Unexpected error")
-    payload = {
-        "project_id": "proj-1",
-        "draft_id": "draft-1",
-        "bump_type": "patch",
-        "description": "desc",
-    }
-    response = client.post("/propose", json=payload)
-    assert response.status_code == 500
-    assert "Unexpected error" in response.json()["detail"]
+    if exc is not None:
+        assert "Orchestrator failed" in response.json()["detail"]
 
 
 # --- Finalize Release Tests ---
 
 
-def test_finalize_release_success(
-    client: TestClient, mock_orchestrator: MagicMock, mock_user_context: UserContext
+@pytest.mark.parametrize(("exc", "status_code"), outcomes(200))
+async def test_finalize_release(
+    client: "httpx.AsyncClient",
+    mock_orchestrator: MagicMock,
+    mock_user_context: "UserContext",
+    exc: Optional[type[Exception]],
+    status_code: int,
 ) -> None:
-    payload = {"mr_id": 123, "srb_signature": "sig"}
-    response = client.post("/release", json=payload)
-    assert response.status_code == 200
+    mock_orchestrator.finalize_release.side_effect = None if exc is None else exc("Orchestrator failed")
+    response = await client.post("/release", content=RELEASE_BODY, headers=JSON_HEADERS)
+    assert response.status_code == status_code
     mock_orchestrator.finalize_release.assert_called_once_with(
         mr_id=123, srb_signature="sig", user_context=mock_user_context
     )
-
-
-def test_finalize_release_value_error(client: TestClient, mock_orchestrator: MagicMock) -> None:
-    mock_orchestrator.finalize_release.side_effect = ValueError("Invalid signature")
-    payload = {"mr_id": 123, "srb_signature": "sig"}
-    response = client.post("/release", json=payload)
-    assert response.status_code == 400
-    assert "Invalid signature" in response.json()["detail"]
-
-
-def test_finalize_release_runtime_error(client: TestClient, mock_orchestrator: MagicMock) -> None:
-    mock_orchestrator.finalize_release.side_effect = RuntimeError("Merge failed")
-    payload = {"mr_id": 123, "srb_signature": "sig"}
-    response = client.post("/release", json=payload)
-    assert response.status_code == 502
-    assert "Merge failed" in response.json()["detail"]
-
-
-def test_finalize_release_exception(client: TestClient, mock_orchestrator: MagicMock) -> None:
-    mock_orchestrator.finalize_release.side_effect = Exception("Crash")
-    payload = {"mr_id": 123, "srb_signature": "sig"}
-    response = client.post("/release", json=payload)
-    assert response.status_code == 500
-    assert "Crash" in response.json()["detail"]
+    if exc is not None:
+        assert "Orchestrator failed" in response.json()["detail"]
 
 
 # --- Reject Release Tests ---
 
 
-def test_reject_release_success(client: TestClient, mock_orchestrator: MagicMock) -> None:
-    payload = {"mr_id": 123, "draft_id": "draft-1", "reason": "bad code"}
-    response = client.post("/reject", json=payload)
-    assert response.status_code == 200
+@pytest.mark.parametrize(("exc", "status_code"), outcomes(200))
+async def test_reject_release(
+    client: "httpx.AsyncClient", mock_orchestrator: MagicMock, exc: Optional[type[Exception]], status_code: int
+) -> None:
+    mock_orchestrator.reject_release.side_effect = None if exc is None else exc("Orchestrator failed")
+    response = await client.post("/reject", content=REJECT_BODY, headers=JSON_HEADERS)
+    assert response.status_code == status_code
     mock_orchestrator.reject_release.assert_called_once_with(mr_id=123, draft_id="draft-1", reason="bad code")
+    if exc is not None:
+        assert "Orchestrator failed" in response.json()["detail"]
 
 
-def test_reject_release_value_error(client: TestClient, mock_orchestrator: MagicMock) -> None:
-    mock_orchestrator.reject_release.side_effect = ValueError("Invalid draft")
-    payload = {"mr_id": 123, "draft_id": "draft-1", "reason": "bad code"}
-    response = client.post("/reject", json=payload)
-    assert response.status_code == 400
-    assert "Invalid draft" in response.json()["detail"]
-
-
-def test_reject_release_runtime_error(client: TestClient, mock_orchestrator: MagicMock) -> None:
-    mock_orchestrator.reject_release.side_effect = RuntimeError("API error")
-    payload = {"mr_id": 123, "draft_id": "draft-1", "reason": "bad code"}
-    response = client.post("/reject", json=payload)
-    assert response.status_code == 502
-    assert "API error" in response.json()["detail"]
+# --- Lifespan Tests ---
 
 
-def test_reject_release_exception(client: TestClient, mock_orchestrator: MagicMock) -> None:
-    mock_orchestrator.reject_release.side_effect = Exception("Boom")
-    payload = {"mr_id": 123, "draft_id": "draft-1", "reason": "bad code"}
-    response = client.post("/reject", json=payload)
-    assert response.status_code == 500
-    assert "Boom" in response.json()["detail"]
+async def test_lifespan_initialization(mock_orchestrator: MagicMock) -> None:
+    """Test that startup stores the orchestrator where get_orch finds it, and shutdown closes it."""
+    from coreason_publisher.server import app, get_orch
 
+    with patch("coreason_publisher.server.get_orchestrator", return_value=mock_orchestrator):
+        async with app.router.lifespan_context(app):
+            assert get_orch(MagicMock(app=app)) is mock_orchestrator
+            mock_orchestrator.close.assert_not_called()
+    mock_orchestrator.close.assert_called_once_with()
+
+
+async def test_lifespan_shutdown_closes_assay_session() -> None:
+    """Test that server shutdown closes the Assay client's pooled session."""
+    from pydantic import SecretStr
+
+    from coreason_publisher.config import PublisherConfig
+    from coreason_publisher.core.http_assay_client import HttpAssayClient
+    from coreason_publisher.core.orchestrator import PublisherOrchestrator
+    from coreason_publisher.server import app
+
+    config = PublisherConfig(assay_api_url="https://assay.test", assay_api_token=SecretStr("token"))
+    assay_client = HttpAssayClient(config)
+    deps = ("foundry_client", "git_provider", "git_local", "git_lfs", "artifact_bundler")
+    orchestrator = PublisherOrchestrator(
+        workspace_path=Path("."),
+        assay_client=assay_client,
+        electronic_signer=MagicMock(),
+        version_manager=MagicMock(),
+        **{name: MagicMock() for name in deps},
+    )
 
-# --- Lifespan Tests ---
+    with patch("coreason_publisher.server.get_orchestrator", return_value=orchestrator):
+        async with app.router.lifespan_context(app):
+            assert not assay_client._session.is_closed
+    assert assay_client._session.is_closed
 
 
-def test_lifespan_initialization_error() -> None:
+async def test_lifespan_initialization_error() -> None:
     """Test that startup fails if get_orchestrator raises exception."""
+    from coreason_publisher.server import app
+
     with patch("coreason_publisher.server.get_orchestrator", side_effect=RuntimeError("Init failed")):
-        # We need to recreate client/app cycle to trigger lifespan
+        # We need to run a fresh lifespan cycle to trigger the startup
         with pytest.raises(RuntimeError, match="Init failed"):
-            with TestClient(app):
+            async with app.router.lifespan_context(app):
                 pass